@@ -1,29 +1,66 @@
+import argparse
+import atexit
+import bisect
 import configparser
+import csv
 import datetime
+import gzip
+import hashlib
+import io
+import itertools
 import json
 import logging
+import logging.handlers
+import math
+import mmap
 import multiprocessing
 import os
 import platform
+import queue
+import re
+import secrets
+import sqlite3
+import sys
 import threading
 import time
 import tkinter as tk
-from datetime import datetime, timedelta
+from array import array
+from concurrent.futures import Future
+from datetime import date, datetime, timedelta
+from multiprocessing.connection import Client, Listener
 from pathlib import Path
-from tkinter import ttk, messagebox, simpledialog, Text, colorchooser
+from tkinter import font as tkfont
+from tkinter import ttk, messagebox, simpledialog, filedialog, Text
+
+STARTUP_STARTED = time.perf_counter()
+
+# NumPy is optional and costs more to import than the rest of the module, so
+# it is only looked up the first time grouped totals are computed.
+numpy = None
+numpy_loaded = False
+
+def load_numpy():
+    global numpy, numpy_loaded
+    if not numpy_loaded:
+        numpy_loaded = True
+        try:
+            import numpy as numpy_module
+        except ImportError:
+            numpy_module = None
+        numpy = numpy_module
+    return numpy
 
 # Initialize logging
 LOGS_DIR = Path(os.path.expanduser("~/.shyft")) / "logs"
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOGS_DIR / 'app.log'),
-        logging.StreamHandler()
-    ]
-)
+LOG_FILE_PATH = LOGS_DIR / "app.log"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_LOG_MAX_BYTES = 1 << 20
+DEFAULT_LOG_BACKUP_COUNT = 5
 logger = logging.getLogger(__name__)
+log_listener = None
+log_listener_pid = None
 
 # Configuration and Paths setup
 if platform.system() == "Darwin":
@@ -35,7 +72,38 @@ else:
 
 APP_SUPPORT_DIR.mkdir(parents=True, exist_ok=True)
 DATA_FILE_PATH = APP_SUPPORT_DIR / "data.json"
+JOURNAL_FILE_PATH = APP_SUPPORT_DIR / "data.journal"
+JOURNAL_COMPACT_THRESHOLD = 500
+SQLITE_FILE_PATH = APP_SUPPORT_DIR / "data.db"
+WRITE_COALESCE_DELAY = 0.05
+WRITE_RETRY_DELAY = 1.0
+VIRTUAL_TABLE_BUFFER_ROWS = 5
+LOAD_POLL_INTERVAL_MS = 20
+LOAD_BATCH_SIZE = 200
+LOAD_BATCH_BUDGET = 0.015
+LOG_INDEX_CHUNK = 1 << 20
+LOG_INDEX_POLL_MS = 100
+LOG_TAIL_INTERVAL_MS = 500
+EXPORT_BATCH_SIZE = 500
+EXPORT_DIALECTS = {"csv": "excel", "tsv": "excel-tab"}
+SESSIONS_DIR = APP_SUPPORT_DIR / "sessions"
+CHECKPOINT_INTERVAL_MS = 5000
+NOTES_DIR = LOGS_DIR / "notes"
+NOTES_MANIFEST_SLACK = 100
+# Archiving is opt-in: `[Notes] archive_after_days` > 0 turns it on.
+DEFAULT_NOTES_ARCHIVE_AFTER_DAYS = 0
+NOTES_INDEX_PATH = APP_SUPPORT_DIR / "notes.db"
+NOTES_SEARCH_LIMIT = 200
+NOTES_INDEX_BATCH_SIZE = 500
+ROLLUPS_FILE_PATH = APP_SUPPORT_DIR / "rollups.json"
+ROLLUP_SAVE_DELAY_MS = 2000
+INSTANCE_LOCK_PATH = APP_SUPPORT_DIR / "instance.lock"
+INSTANCE_INFO_PATH = APP_SUPPORT_DIR / "instance.json"
+INSTANCE_POLL_INTERVAL_MS = 200
+INSTANCE_HANDOFF_TIMEOUT = 5.0
+DEFAULT_STORAGE_ENGINE = "journal"
 CONFIG_FILE = APP_SUPPORT_DIR / "config.ini"
+CONFIG_SAVE_DELAY = 1.0
 
 DEFAULT_SHIFT_STRUCTURE = {
     "Date": "",
@@ -48,6 +116,199 @@ DEFAULT_SHIFT_STRUCTURE = {
     "Gross pay": "",
 }
 
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+class AppConfig:
+    # The one copy of config.ini in this process. Getters read the cached
+    # parser and never touch the disk; set() notifies listeners and marks
+    # the value for a debounced, atomic rewrite of the file. If the file
+    # was edited by hand in the meantime, it is re-read and only the values
+    # set here are applied on top.
+    def __init__(self, path, save_delay=CONFIG_SAVE_DELAY):
+        self.path = Path(path)
+        self.save_delay = save_delay
+        self.lock = threading.RLock()
+        self.save_lock = threading.Lock()
+        self.listeners = []
+        self.changes = {}
+        self.save_timer = None
+        self.reload()
+
+    def reload(self):
+        parser = configparser.ConfigParser()
+        signature = file_signature(self.path)
+        try:
+            parser.read(self.path)
+        except configparser.Error as e:
+            logger.error(f"Failed to read {self.path.name}: {e}")
+        with self.lock:
+            self.parser = parser
+            self.signature = signature
+            for (section, option), value in self.changes.items():
+                self.store(section, option, value)
+
+    def get(self, section, option, fallback=None):
+        with self.lock:
+            return self.parser.get(section, option, fallback=fallback)
+
+    def get_typed(self, getter, section, option, fallback):
+        with self.lock:
+            try:
+                return getter(section, option, fallback=fallback)
+            except ValueError:
+                logger.warning(f"Invalid value for [{section}] {option} in {self.path.name}, using {fallback!r}.")
+                return fallback
+
+    def getint(self, section, option, fallback=None):
+        return self.get_typed(self.parser.getint, section, option, fallback)
+
+    def getfloat(self, section, option, fallback=None):
+        return self.get_typed(self.parser.getfloat, section, option, fallback)
+
+    def getboolean(self, section, option, fallback=None):
+        return self.get_typed(self.parser.getboolean, section, option, fallback)
+
+    def store(self, section, option, value):
+        if not self.parser.has_section(section):
+            self.parser.add_section(section)
+        self.parser.set(section, option, value)
+
+    def set(self, section, option, value):
+        value = str(value)
+        with self.lock:
+            if self.parser.get(section, option, fallback=None) == value:
+                return False
+            self.store(section, option, value)
+            self.changes[(section, option)] = value
+            if self.save_timer is None:
+                self.save_timer = threading.Timer(self.save_delay, self.flush)
+                self.save_timer.daemon = True
+                self.save_timer.start()
+        for listener in list(self.listeners):
+            try:
+                listener(section, option, value)
+            except Exception as e:
+                logger.error(f"Config listener failed for [{section}] {option}: {e}")
+        return True
+
+    def add_listener(self, listener):
+        # Called as listener(section, option, value) on the thread that
+        # called set().
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def flush(self):
+        with self.save_lock:
+            with self.lock:
+                if self.save_timer is not None:
+                    self.save_timer.cancel()
+                    self.save_timer = None
+                if not self.changes:
+                    return False
+            if file_signature(self.path) != self.signature:
+                self.reload()
+            with self.lock:
+                buffer = io.StringIO()
+                self.parser.write(buffer)
+                changes, self.changes = self.changes, {}
+            try:
+                atomic_write_text(self.path, buffer.getvalue())
+            except OSError as e:
+                with self.lock:
+                    # Values set while the write was failing take precedence.
+                    self.changes = {**changes, **self.changes}
+                logger.error(f"Failed to save {self.path.name}: {e}")
+                return False
+            with self.lock:
+                self.signature = file_signature(self.path)
+        logger.debug("Saved %d config value(s).", len(changes))
+        return True
+
+app_config = AppConfig(CONFIG_FILE)
+
+def apply_config_change(section, option, value):
+    if (section, option) == ("Logging", "level"):
+        level = logging.getLevelName(value.upper())
+        if isinstance(level, int):
+            logging.getLogger().setLevel(level)
+
+def setup_logging():
+    # Callers only pay for putting a record on a queue; a listener thread
+    # does the file and console I/O. `[Logging]` in config.ini sets the
+    # level and the rotation of app.log. Safe to call again in a forked
+    # child, where the parent's listener thread no longer exists.
+    global log_listener, log_listener_pid
+    if log_listener_pid == os.getpid():
+        stop_logging()
+    log_listener = None
+    level_name = app_config.get("Logging", "level", fallback=DEFAULT_LOG_LEVEL).upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        level = logging.getLevelName(DEFAULT_LOG_LEVEL)
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE_PATH,
+        maxBytes=app_config.getint("Logging", "max_bytes", fallback=DEFAULT_LOG_MAX_BYTES),
+        backupCount=app_config.getint("Logging", "backup_count", fallback=DEFAULT_LOG_BACKUP_COUNT),
+        encoding="utf-8",
+    )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(level)
+    log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    log_listener.start()
+    log_listener_pid = os.getpid()
+    if level_name != logging.getLevelName(level):
+        logger.warning(f"Unknown log level '{level_name}', using {DEFAULT_LOG_LEVEL}.")
+
+def stop_logging():
+    global log_listener
+    if log_listener is not None and log_listener_pid == os.getpid():
+        log_listener.stop()
+        for handler in log_listener.handlers:
+            handler.close()
+        log_listener = None
+
+class StartupTimer:
+    # Time spent in each startup phase, logged as one line once the shifts
+    # are on screen so that cold starts can be compared over time.
+    def __init__(self, started):
+        self.started = self.last = started
+        self.phases = []
+        self.reported = False
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self):
+        if self.reported:
+            return
+        self.reported = True
+        phases = ", ".join(f"{phase} {seconds * 1000:.0f} ms" for phase, seconds in self.phases)
+        logger.info(f"Startup took {(self.last - self.started) * 1000:.0f} ms ({phases}).")
+
+startup_timer = StartupTimer(STARTUP_STARTED)
+setup_logging()
+atexit.register(stop_logging)
+atexit.register(app_config.flush)
+app_config.add_listener(apply_config_change)
 logger.debug("Configuration and paths setup completed.")
 
 def get_modifier_key():
@@ -83,23 +344,63 @@ def minimize_window(event=None):
     widget.iconify()
     logger.debug("Minimized window.")
 
+def format_elapsed(seconds):
+    return str(timedelta(seconds=int(seconds))).rjust(8, "0")
+
+class TimerScheduler:
+    # The one Tk `after` job behind every timer. It wakes when the displayed
+    # second of the soonest running timer rolls over, refreshes the running
+    # timers and then the listeners, and stays idle while nothing runs.
+    def __init__(self, root):
+        self.root = root
+        self.timers = []
+        self.listeners = []
+        self.job = None
+
+    def register(self, timer):
+        self.timers.append(timer)
+
+    def unregister(self, timer):
+        if timer in self.timers:
+            self.timers.remove(timer)
+        self.wake()
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def wake(self):
+        # Called whenever a timer starts or stops, so the next tick is
+        # recomputed right away.
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+        self.tick()
+
+    def tick(self):
+        self.job = None
+        delay_ms = None
+        for timer in self.timers:
+            if timer.running:
+                elapsed = timer.current_elapsed().total_seconds()
+                timer.refresh(elapsed)
+                timer_delay_ms = int((1 - elapsed % 1) * 1000) + 1
+                if delay_ms is None or timer_delay_ms < delay_ms:
+                    delay_ms = timer_delay_ms
+        for callback in self.listeners:
+            callback()
+        if delay_ms is not None:
+            self.job = self.root.after(delay_ms, self.tick)
+
 class TimerWindow:
-    def __init__(self, root, time_color="#A78C7B", bg_color="#FFBE98"):
+    def __init__(self, root, time_color="#A78C7B", bg_color="#FFBE98", scheduler=None, name=None):
         self.root = root
-        self.config = configparser.ConfigParser()
-        self.config.read(CONFIG_FILE)
-
-        if not self.config.has_section("Window"):
-            self.config.add_section("Window")
-            self.custom_width = 200
-            self.custom_height = 100
-            logger.debug("No 'Window' section found in config file, using default dimensions.")
-        else:
-            self.custom_width = self.config.getint("Window", "width", fallback=200)
-            self.custom_height = self.config.getint("Window", "height", fallback=100)
-            logger.debug(f"Loaded custom dimensions from config file: width={self.custom_width}, height={self.custom_height}")
+        self.name = name
+        self.scheduler = scheduler or TimerScheduler(root)
+        self.custom_width = app_config.getint("Window", "width", fallback=200)
+        self.custom_height = app_config.getint("Window", "height", fallback=100)
+        logger.debug(f"Timer window dimensions: width={self.custom_width}, height={self.custom_height}")
 
-        self.root.title("Timer")
+        self.root.title(f"Timer - {name}" if name else "Timer")
         self.root.geometry(f"{self.custom_width}x{self.custom_height}")
         self.root.configure(bg=bg_color)
 
@@ -165,27 +466,37 @@ class TimerWindow:
         button_frame.grid_columnconfigure(1, weight=1)
         button_frame.grid_columnconfigure(2, weight=1)
 
-        self.update_timer_thread = threading.Thread(target=self.update_timer, daemon=True)
-        self.update_timer_thread.start()
+        self.shown_seconds = None
+        self.scheduler.register(self)
         logger.info("Timer window initialized.")
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
+    # `last_time` is a `time.monotonic()` reading, so wall-clock changes
+    # never leak into the billed time.
+    def current_elapsed(self):
+        if self.running:
+            return self.elapsed_time + timedelta(seconds=time.monotonic() - self.last_time)
+        return self.elapsed_time
+
     def start(self):
         if not self.running:
             self.running = True
-            self.last_time = datetime.now()
+            self.last_time = time.monotonic()
+            self.scheduler.wake()
             logger.debug("Timer started.")
 
     def stop(self):
         if self.running:
+            self.elapsed_time = self.current_elapsed()
             self.running = False
-            self.elapsed_time += datetime.now() - self.last_time
+            self.scheduler.wake()
             logger.debug("Timer stopped.")
 
     def reset(self):
         self.stop()
         self.elapsed_time = timedelta(0)
+        self.shown_seconds = None
         self.update_label("00:00:00")
         logger.debug("Timer reset.")
 
@@ -193,74 +504,2006 @@ class TimerWindow:
         if self.timer_label.winfo_exists():
             self.timer_label.config(text=text)
 
-    def update_timer(self):
-        while True:
-            if self.running:
-                current_time = datetime.now()
-                delta = current_time - self.last_time
-                elapsed = self.elapsed_time + delta
-                self.root.after(0, self.update_label, str(elapsed).split(".")[0].rjust(8, "0"))
-            time.sleep(0.1)
+    def refresh(self, elapsed):
+        seconds = int(elapsed)
+        if seconds != self.shown_seconds:
+            self.shown_seconds = seconds
+            self.update_label(format_elapsed(seconds))
 
     def on_close(self):
-        self.running = False
-        self.config.set("Window", "width", str(self.root.winfo_width()))
-        self.config.set("Window", "height", str(self.root.winfo_height()))
-        with open(CONFIG_FILE, "w") as config_file:
-            self.config.write(config_file)
+        self.stop()
+        self.scheduler.unregister(self)
+        app_config.set("Window", "width", self.root.winfo_width())
+        app_config.set("Window", "height", self.root.winfo_height())
         logger.debug(f"Timer window dimensions saved: width={self.root.winfo_width()}, height={self.root.winfo_height()}")
         self.root.after(0, self.root.destroy)
         logger.debug("Timer window closed.")
 
+def parse_date_ordinal(value):
+    return date.fromisoformat(value).toordinal()
+
+def format_date_ordinal(ordinal):
+    return date.fromordinal(ordinal).isoformat()
+
+def parse_minutes(value):
+    hours, minutes = value.split(":")
+    hours, minutes = int(hours), int(minutes)
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"Invalid time {value}")
+    return hours * 60 + minutes
+
+def format_minutes(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+def parse_hundredths(value):
+    hundredths = float(value) * 100
+    # inf, nan and anything that overflows once scaled cannot be rounded to
+    # an int; treat them like any other unparsable value.
+    if not math.isfinite(hundredths):
+        raise ValueError(f"could not convert string to a finite number: {value!r}")
+    return round(hundredths)
+
+def format_hundredths(value):
+    return f"{value / 100:.2f}"
+
+class ShiftRecord:
+    # In-memory form of a shift. Dates are ordinals, times are minutes past
+    # midnight, and durations and money are hundredths (hours, cents), so
+    # aggregation never has to parse strings. `DEFAULT_SHIFT_STRUCTURE`-style
+    # dicts only exist at the storage and widget boundaries.
+    __slots__ = ("date", "model_id", "project_id", "time_in", "time_out", "duration", "rate", "gross", "raw")
+
+    FIELDS = {
+        "Date": ("date", parse_date_ordinal, format_date_ordinal),
+        "Model ID": ("model_id", None, None),
+        "Project ID": ("project_id", None, None),
+        "In (hh:mm)": ("time_in", parse_minutes, format_minutes),
+        "Out (hh:mm)": ("time_out", parse_minutes, format_minutes),
+        "Duration (hrs)": ("duration", parse_hundredths, format_hundredths),
+        "Hourly rate": ("rate", parse_hundredths, format_hundredths),
+        "Gross pay": ("gross", parse_hundredths, format_hundredths),
+    }
+
+    def __init__(self, date=None, model_id="", project_id="", time_in=None, time_out=None,
+                 duration=None, rate=None, gross=None, raw=None):
+        self.date = date
+        self.model_id = sys.intern(model_id)
+        self.project_id = sys.intern(project_id)
+        self.time_in = time_in
+        self.time_out = time_out
+        self.duration = duration
+        self.rate = rate
+        self.gross = gross
+        # Original strings for any field that could not be parsed, kept so
+        # that hand-edited data survives a round trip unchanged.
+        self.raw = raw
+
+    @classmethod
+    def from_dict(cls, shift):
+        record = cls()
+        for field, (attr, parse, _) in cls.FIELDS.items():
+            value = str(shift.get(field, "")).strip()
+            if parse is None:
+                setattr(record, attr, sys.intern(value))
+            elif value:
+                try:
+                    setattr(record, attr, parse(value))
+                except ValueError:
+                    if record.raw is None:
+                        record.raw = {}
+                    record.raw[field] = value
+        return record
+
+    def get(self, field, default=None):
+        if field not in self.FIELDS:
+            return default
+        if self.raw is not None and field in self.raw:
+            return self.raw[field]
+        attr, _, format_value = self.FIELDS[field]
+        value = getattr(self, attr)
+        if format_value is None:
+            return value
+        return "" if value is None else format_value(value)
+
+    def __getitem__(self, field):
+        if field not in self.FIELDS:
+            raise KeyError(field)
+        return self.get(field)
+
+    def to_dict(self):
+        return {field: self.get(field) for field in DEFAULT_SHIFT_STRUCTURE}
+
+    def __eq__(self, other):
+        if not isinstance(other, ShiftRecord):
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
+
+    def __repr__(self):
+        return f"ShiftRecord({self.to_dict()})"
+
+def load_shift_records(data):
+    return {shift_id: ShiftRecord.from_dict(shift) for shift_id, shift in data.items()}
+
+def dump_shift_records(records):
+    return {shift_id: record.to_dict() for shift_id, record in records.items()}
+
+def shift_in_date_range(shift, start=None, end=None):
+    if start is None and end is None:
+        return True
+    if shift.date is None:
+        return False
+    return (start is None or shift.date >= start) and (end is None or shift.date <= end)
+
+def shifts_in_date_order(data, start=None, end=None):
+    shift_ids = sorted(
+        (shift_id for shift_id, shift in data.items() if shift_in_date_range(shift, start, end)),
+        key=lambda shift_id: (shift_sort_key(shift_id, data[shift_id], "Date"), shift_sort_key(shift_id, data[shift_id], "ID")),
+    )
+    return ((shift_id, data[shift_id]) for shift_id in shift_ids)
+
+def atomic_write_text(path, text):
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def atomic_write_json(path, payload, indent=4, private=False):
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    # A private file is owner-only from the moment it is created, so its
+    # contents are never readable by others before the rename.
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600 if private else 0o666)
+    if private and hasattr(os, "fchmod"):
+        os.fchmod(fd, 0o600)  # a leftover temp file keeps its old mode
+    with os.fdopen(fd, "w") as f:
+        json.dump(payload, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+class SessionCheckpoints:
+    # One small JSON file per open autologger timer, so that a crash loses at
+    # most one checkpoint interval. A file is only rewritten when its payload
+    # differs from what this process last wrote.
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.written = {}
+
+    def path(self, name):
+        digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def save(self, name, state):
+        if self.written.get(name) == state:
+            return False
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = dict(state, checkpointed_at=datetime.now().isoformat(timespec="seconds"))
+        atomic_write_json(self.path(name), payload, indent=None)
+        self.written[name] = state
+        return True
+
+    def discard(self, name):
+        self.written.pop(name, None)
+        try:
+            self.path(name).unlink()
+        except FileNotFoundError:
+            pass
+
+    def load_all(self):
+        sessions = []
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                with path.open("r") as f:
+                    sessions.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to read checkpoint {path.name}: {e}")
+        return sessions
+
+def diff_shift_records(old, new):
+    changes = {shift_id: shift for shift_id, shift in new.items() if old.get(shift_id) != shift}
+    changes.update((shift_id, None) for shift_id in old if shift_id not in new)
+    return changes
+
+def apply_shift_changes(data, changes):
+    for shift_id, shift in changes.items():
+        if shift is None:
+            data.pop(shift_id, None)
+        else:
+            data[shift_id] = shift
+
+class JsonShiftStore:
+    # The original storage format: the whole history in `data.json`. Writes
+    # still rewrite the file, but atomically and once per coalesced batch.
+    def __init__(self, data_file_path):
+        self.data_file_path = Path(data_file_path)
+        self.lock = threading.Lock()
+        self.records = {}
+        self.signature = None
+
+    def load(self):
+        with self.lock:
+            self.records = self.read_file()
+            return dict(self.records)
+
+    def read_file(self):
+        self.signature = file_signature(self.data_file_path)
+        if self.signature is None:
+            return {}
+        with self.data_file_path.open("r") as f:
+            return load_shift_records(json.load(f).get("data", {}))
+
+    def load_changes(self, known):
+        with self.lock:
+            if file_signature(self.data_file_path) == self.signature:
+                return None
+            records = self.read_file()
+            changes = diff_shift_records(self.records, records)
+            self.records = records
+            return changes
+
+    def write_file(self):
+        atomic_write_json(self.data_file_path, {"data": dump_shift_records(self.records)})
+        self.signature = file_signature(self.data_file_path)
+
+    def write_changes(self, changes):
+        with self.lock:
+            apply_shift_changes(self.records, changes)
+            self.write_file()
+
+    def iter_shifts(self, start=None, end=None):
+        return shifts_in_date_order(self.load(), start, end)
+
+    def maintain(self):
+        pass
+
+    def close(self):
+        pass
+
+class ShiftJournal:
+    # `data.json` is the snapshot; every mutation since the last compaction is
+    # appended to `data.journal` as one JSON line and replayed on load. A
+    # read-only journal never compacts, so readers such as --export leave
+    # the files to the GUI.
+    def __init__(self, snapshot_path, journal_path, compact_threshold=JOURNAL_COMPACT_THRESHOLD, read_only=False):
+        self.snapshot_path = Path(snapshot_path)
+        self.read_only = read_only
+        self.journal_path = Path(journal_path)
+        self.pending_path = self.journal_path.with_name(self.journal_path.name + ".pending")
+        self.compact_threshold = compact_threshold
+        self.records_since_compaction = 0
+        self.lock = threading.Lock()
+        self.records = {}
+        # Until the snapshot has been read, self.records only holds what was
+        # written since, and compacting would replace data.json with it.
+        self.loaded = False
+        # What this process last saw of each file, and how far into the
+        # journal it has read, so that a refresh can skip unchanged files or
+        # read only the records another process appended.
+        self.snapshot_signature = None
+        self.pending_signature = None
+        self.journal_signature = None
+        self.journal_offset = 0
+
+    def load(self):
+        with self.lock:
+            self.records = self.read_files()
+            self.loaded = True
+        logger.debug("Loaded snapshot and replayed %d journal records.", self.records_since_compaction)
+        return dict(self.records)
+
+    def iter_shifts(self, start=None, end=None):
+        return shifts_in_date_order(self.load(), start, end)
+
+    def read_files(self):
+        # Signatures are only recorded once everything parsed, so that a
+        # failed read is retried in full rather than skipped as unchanged.
+        snapshot_signature = file_signature(self.snapshot_path)
+        pending_signature = file_signature(self.pending_path)
+        journal_signature = file_signature(self.journal_path)
+        data = {}
+        if snapshot_signature is not None:
+            with self.snapshot_path.open("r") as f:
+                data = load_shift_records(json.load(f).get("data", {}))
+        pending, replayed, _ = self.read_journal(self.pending_path)
+        journal, count, self.journal_offset = self.read_journal(self.journal_path)
+        self.snapshot_signature = snapshot_signature
+        self.pending_signature = pending_signature
+        self.journal_signature = journal_signature
+        apply_shift_changes(data, pending)
+        apply_shift_changes(data, journal)
+        self.records_since_compaction = replayed + count
+        return data
+
+    def read_journal(self, path, offset=0):
+        # Returns the last change per shift id, the number of records read
+        # and the offset just past the last complete line, which is where the
+        # next read of an append-only file should resume.
+        try:
+            f = path.open("rb")
+        except FileNotFoundError:
+            return {}, 0, 0
+        with f:
+            f.seek(offset)
+            chunk = f.read()
+        complete = chunk.rfind(b"\n") + 1
+        changes = {}
+        count = 0
+        for line in chunk[:complete].decode("utf-8").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn write can only affect the last record.
+                logger.error(f"Skipping corrupt journal record in {path.name}.")
+                continue
+            if record.get("op") == "put":
+                changes[record["id"]] = ShiftRecord.from_dict(record["shift"])
+            elif record.get("op") == "delete":
+                changes[record["id"]] = None
+            count += 1
+        return changes, count, offset + complete
+
+    def load_changes(self, known):
+        with self.lock:
+            journal_signature = file_signature(self.journal_path)
+            if (
+                file_signature(self.snapshot_path) == self.snapshot_signature
+                and file_signature(self.pending_path) == self.pending_signature
+            ):
+                if journal_signature == self.journal_signature:
+                    return None
+                if journal_signature is not None and journal_signature[1] >= self.journal_offset:
+                    changes, count, self.journal_offset = self.read_journal(
+                        self.journal_path, self.journal_offset
+                    )
+                    self.journal_signature = journal_signature
+                    self.records_since_compaction += count
+                    apply_shift_changes(self.records, changes)
+                    logger.debug("Merged %d journal records appended by another process.", count)
+                    return changes
+            records = self.read_files()
+            changes = diff_shift_records(self.records, records)
+            self.records = records
+            self.loaded = True
+            return changes
+
+    def write_changes(self, changes):
+        lines = []
+        for shift_id, shift in changes.items():
+            if shift is None:
+                record = {"op": "delete", "id": shift_id}
+            else:
+                record = {"op": "put", "id": shift_id, "shift": shift.to_dict()}
+            lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+        payload = "".join(lines).encode("utf-8")
+        with self.lock:
+            with self.journal_path.open("ab") as f:
+                start = f.seek(0, os.SEEK_END)
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            if start == self.journal_offset:
+                # Nothing was appended by anyone else since our last read.
+                self.journal_offset = start + len(payload)
+                self.journal_signature = file_signature(self.journal_path)
+            apply_shift_changes(self.records, changes)
+            self.records_since_compaction += len(lines)
+
+    def needs_compaction(self):
+        return self.loaded and not self.read_only and self.records_since_compaction >= self.compact_threshold
+
+    def compact(self):
+        if self.read_only:
+            return
+        with self.lock:
+            if not self.loaded:
+                logger.warning("Not compacting the journal: the snapshot was never loaded.")
+                return
+            if self.journal_path.exists():
+                if self.pending_path.exists():
+                    # An earlier compaction never finished; keep its records.
+                    with self.pending_path.open("a") as pending, self.journal_path.open("r") as journal:
+                        pending.write(journal.read())
+                    self.journal_path.unlink()
+                else:
+                    os.replace(self.journal_path, self.pending_path)
+            self.journal_signature = None
+            self.journal_offset = 0
+            snapshot = dict(self.records)
+            self.records_since_compaction = 0
+        try:
+            atomic_write_json(self.snapshot_path, {"data": dump_shift_records(snapshot)})
+            with self.lock:
+                if self.pending_path.exists():
+                    self.pending_path.unlink()
+                self.snapshot_signature = file_signature(self.snapshot_path)
+                self.pending_signature = None
+            logger.debug("Compacted journal into snapshot (%d shifts).", len(snapshot))
+        except Exception as e:
+            logger.error(f"Journal compaction failed: {e}")
+
+    def maintain(self):
+        if self.needs_compaction():
+            self.compact()
+
+    def close(self):
+        if self.records_since_compaction and not self.read_only:
+            self.compact()
+
+class SQLiteShiftStore:
+    COLUMNS = {
+        "Date": "date",
+        "Model ID": "model_id",
+        "Project ID": "project_id",
+        "In (hh:mm)": "time_in",
+        "Out (hh:mm)": "time_out",
+        "Duration (hrs)": "duration_hrs",
+        "Hourly rate": "hourly_rate",
+        "Gross pay": "gross_pay",
+    }
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path, legacy_snapshot_path=DATA_FILE_PATH, legacy_journal_path=JOURNAL_FILE_PATH, read_only=False):
+        self.db_path = Path(db_path)
+        self.legacy_snapshot_path = Path(legacy_snapshot_path)
+        self.legacy_journal_path = Path(legacy_journal_path)
+        self.lock = threading.Lock()
+        self.data_version = None
+        if read_only:
+            # No schema changes or migration; the database must exist.
+            self.conn = sqlite3.connect(f"{self.db_path.as_uri()}?mode=ro", uri=True, check_same_thread=False)
+            return
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.create_schema()
+
+    def create_schema(self):
+        columns = ", ".join(f"{column} TEXT NOT NULL DEFAULT ''" for column in self.COLUMNS.values())
+        with self.lock, self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS shifts (id TEXT PRIMARY KEY, {columns})")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_shifts_date ON shifts(date)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_shifts_model_id ON shifts(model_id)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_shifts_project_id ON shifts(project_id)")
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < self.SCHEMA_VERSION:
+                self.migrate_from_json()
+                self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def migrate_from_json(self):
+        if not self.legacy_snapshot_path.exists() and not self.legacy_journal_path.exists():
+            return
+        try:
+            data = ShiftJournal(self.legacy_snapshot_path, self.legacy_journal_path).load()
+        except Exception as e:
+            logger.error(f"Failed to read {self.legacy_snapshot_path.name} for migration: {e}")
+            return
+        self.conn.executemany(self.upsert_sql(), (self.row(k, v) for k, v in data.items()))
+        logger.info(f"Migrated {len(data)} shifts from {self.legacy_snapshot_path.name} to {self.db_path.name}.")
+
+    def upsert_sql(self):
+        columns = ", ".join(self.COLUMNS.values())
+        placeholders = ", ".join("?" for _ in range(len(self.COLUMNS) + 1))
+        updates = ", ".join(f"{column} = excluded.{column}" for column in self.COLUMNS.values())
+        return (
+            f"INSERT INTO shifts (id, {columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+
+    def row(self, shift_id, shift):
+        return (shift_id, *(shift.get(field, "") for field in self.COLUMNS))
+
+    def shift_from_row(self, row):
+        return ShiftRecord.from_dict(dict(zip(self.COLUMNS, row[1:])))
+
+    def query(self, where="", params=()):
+        columns = ", ".join(self.COLUMNS.values())
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT id, {columns} FROM shifts {where} ORDER BY rowid", params
+            ).fetchall()
+        return {row[0]: self.shift_from_row(row) for row in rows}
+
+    def load(self):
+        with self.lock:
+            self.data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        data = self.query()
+        logger.debug("Loaded %d shifts from %s.", len(data), self.db_path.name)
+        return data
+
+    def load_changes(self, known):
+        # data_version only moves when another connection commits.
+        with self.lock:
+            data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self.data_version:
+            return None
+        return diff_shift_records(known, self.load())
+
+    def iter_shifts(self, start=None, end=None):
+        # Streams from a cursor in date order instead of materializing the
+        # table; ISO dates compare correctly as text, and the parsed ordinal
+        # is checked again to drop malformed dates that slipped between.
+        low = format_date_ordinal(start) if start is not None else ""
+        high = format_date_ordinal(end) if end is not None else "\uffff"
+        columns = ", ".join(self.COLUMNS.values())
+        with self.lock:
+            cursor = self.conn.execute(
+                f"SELECT id, {columns} FROM shifts WHERE date BETWEEN ? AND ? ORDER BY date, rowid",
+                (low, high),
+            )
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                shift = self.shift_from_row(row)
+                if shift_in_date_range(shift, start, end):
+                    yield row[0], shift
+
+    def write_changes(self, changes):
+        upserts = [self.row(k, v) for k, v in changes.items() if v is not None]
+        deletes = [(k,) for k, v in changes.items() if v is None]
+        with self.lock, self.conn:
+            self.conn.executemany(self.upsert_sql(), upserts)
+            self.conn.executemany("DELETE FROM shifts WHERE id = ?", deletes)
+
+    def maintain(self):
+        pass
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class StorageWriter:
+    # The single thread that touches the storage engine. Changes are tracked
+    # per shift id, so a burst of edits to the same shift costs one write. A
+    # batch that fails to write is queued again and retried, since the
+    # journal and SQLite engines only ever write what changed.
+    def __init__(self, storage, coalesce_delay=WRITE_COALESCE_DELAY, retry_delay=WRITE_RETRY_DELAY):
+        self.storage = storage
+        self.coalesce_delay = coalesce_delay
+        self.retry_delay = retry_delay
+        self.condition = threading.Condition()
+        self.dirty = {}
+        self.futures = []
+        self.in_flight = {}
+        self.closing = False
+        self.thread = threading.Thread(target=self.run, name="StorageWriter", daemon=True)
+        self.thread.start()
+
+    def submit(self, shift_id, shift):
+        future = Future()
+        with self.condition:
+            self.dirty[shift_id] = shift
+            self.futures.append(future)
+            self.condition.notify()
+        return future
+
+    def overlay(self, data):
+        # Changes that are queued or being written are newer than anything
+        # the storage engine can return, so apply them on top of a load.
+        with self.condition:
+            batches = [self.in_flight, dict(self.dirty)]
+        for changes in batches:
+            for shift_id, shift in changes.items():
+                if shift is None:
+                    data.pop(shift_id, None)
+                else:
+                    data[shift_id] = shift
+        return data
+
+    def pending_ids(self):
+        with self.condition:
+            return set(self.in_flight) | set(self.dirty)
+
+    def has_pending(self):
+        return bool(self.dirty)
+
+    def run(self):
+        failed = False
+        while True:
+            with self.condition:
+                while not self.has_pending() and not self.closing:
+                    self.condition.wait()
+                deadline = time.monotonic() + (self.retry_delay if failed else self.coalesce_delay)
+                while not self.closing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                changes, futures = self.dirty, self.futures
+                self.dirty, self.futures = {}, []
+                self.in_flight = changes
+            failed = bool(changes) and not self.write(changes, futures)
+            with self.condition:
+                self.in_flight = {}
+                if self.closing and failed:
+                    logger.error(f"Giving up on {len(self.dirty)} unsaved shifts at shutdown.")
+                    break
+                if self.closing and not self.has_pending():
+                    break
+
+    def write(self, changes, futures):
+        try:
+            self.storage.write_changes(changes)
+            self.storage.maintain()
+        except Exception as e:
+            logger.error(f"Save Failed: {e}")
+            with self.condition:
+                # Values queued since this batch was taken are newer.
+                self.dirty = {**changes, **self.dirty}
+            for future in futures:
+                future.set_exception(e)
+            return False
+        logger.debug("Wrote %d changed shifts.", len(changes))
+        for future in futures:
+            future.set_result(len(changes))
+        return True
+
+    def close(self, timeout=10):
+        with self.condition:
+            self.closing = True
+            self.condition.notify()
+        self.thread.join(timeout)
+        self.storage.close()
+
+class NotesManifest:
+    # Autologger notes live in `notes/YYYY/MM/{shift id}.md`, and
+    # `notes/manifest.jsonl` gets one line per note written (id, date,
+    # project, size, relative path), so that listing notes never walks the
+    # directory tree. Later lines for an id win; the file is rewritten once
+    # superseded lines make up half of it.
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.path = self.directory / "manifest.jsonl"
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.lines = 0
+        self.signature = None
+
+    def load(self):
+        # Re-reads the manifest only when it changed on disk.
+        with self.lock:
+            signature = file_signature(self.path)
+            if signature == self.signature:
+                return dict(self.entries)
+            entries = {}
+            lines = 0
+            if signature is not None:
+                with self.path.open("r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        entries[entry["id"]] = entry
+                        lines += 1
+            self.entries, self.lines, self.signature = entries, lines, signature
+            if lines > 2 * len(entries) + NOTES_MANIFEST_SLACK:
+                self.rewrite()
+            return dict(self.entries)
+
+    def rewrite(self):
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.lines = len(self.entries)
+        self.signature = file_signature(self.path)
+
+    def append(self, entries):
+        with self.lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # If the file moved on since it was last read, leave the cached
+            # signature stale so that the next load() picks everything up.
+            current = file_signature(self.path) == self.signature
+            with self.path.open("a", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            for entry in entries:
+                self.entries[entry["id"]] = entry
+            self.lines += len(entries)
+            if current:
+                self.signature = file_signature(self.path)
+
+    def shard(self, shift_date):
+        if shift_date is None:
+            return "undated"
+        return f"{shift_date.year:04d}/{shift_date.month:02d}"
+
+    def entry(self, shift_id, shift_date, project_id, path):
+        return {
+            "id": shift_id,
+            "date": shift_date.isoformat() if shift_date else "",
+            "project": project_id or "",
+            "size": path.stat().st_size,
+            "path": path.relative_to(self.directory).as_posix(),
+        }
+
+    def write_note(self, shift_id, shift_date, project_id, notes):
+        path = self.directory / self.shard(shift_date) / f"{shift_id}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as file:
+            file.write(notes)
+        self.append([self.entry(shift_id, shift_date, project_id, path)])
+        return path
+
+    def note_files(self):
+        # Archived notes come back with no path.
+        return [
+            (shift_id, None if "archive" in entry else self.directory / entry["path"])
+            for shift_id, entry in self.load().items()
+        ]
+
+    def read_archived(self, entry):
+        with (self.directory / entry["archive"]).open("rb") as f:
+            f.seek(entry["offset"])
+            return gzip.decompress(f.read(entry["length"]))
+
+    def read_archived_note(self, shift_id):
+        with self.lock:
+            entry = self.entries[shift_id]
+        return self.read_archived(entry)
+
+    def archive(self, cutoff):
+        # Packs notes dated before `cutoff` into `archive/YYYY-MM.gz`, one
+        # gzip member per note, one month per step. The manifest records each
+        # member's offset and length so a note is read back with one seek.
+        # Originals are only deleted once their members and manifest lines
+        # are on disk; a crash in between leaves unreferenced bytes at worst.
+        months = {}
+        for entry in self.load().values():
+            if "archive" not in entry and entry["date"] and entry["date"] < cutoff.isoformat():
+                months.setdefault(entry["date"][:7], []).append(entry)
+        archived = 0
+        for month, entries in sorted(months.items()):
+            segment = f"archive/{month}.gz"
+            segment_path = self.directory / segment
+            segment_path.parent.mkdir(parents=True, exist_ok=True)
+            updated = []
+            with segment_path.open("ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                for entry in entries:
+                    try:
+                        member = gzip.compress((self.directory / entry["path"]).read_bytes(), mtime=0)
+                    except FileNotFoundError:
+                        continue
+                    f.write(member)
+                    updated.append(dict(entry, archive=segment, offset=offset, length=len(member)))
+                    offset += len(member)
+                f.flush()
+                os.fsync(f.fileno())
+            self.append(updated)
+            for entry in updated:
+                path = self.directory / entry["path"]
+                path.unlink()
+                try:
+                    path.parent.rmdir()
+                    path.parent.parent.rmdir()
+                except OSError:
+                    pass
+            archived += len(updated)
+        if archived:
+            logger.info(f"Archived {archived} notes dated before {cutoff.isoformat()}.")
+
+    def migrate(self, legacy_directory, data):
+        # Moves notes from the old flat `LOGS_DIR/{id}.md` layout into their
+        # shards, dated by their shift or else by the file's mtime.
+        entries = []
+        for path in Path(legacy_directory).glob("*.md"):
+            shift_id = path.stem
+            shift = data.get(shift_id)
+            if shift is not None and shift.date is not None:
+                shift_date = date.fromordinal(shift.date)
+            else:
+                shift_date = date.fromtimestamp(path.stat().st_mtime)
+            target = self.directory / self.shard(shift_date) / path.name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, target)
+            entries.append(self.entry(shift_id, shift_date, shift.project_id if shift else "", target))
+        if entries:
+            self.append(entries)
+            logger.info(f"Moved {len(entries)} notes into {self.directory}.")
+
+class NotesIndex:
+    # Full-text index over the autologger notes in an SQLite FTS5 table (a
+    # plain table searched with LIKE where SQLite lacks FTS5). `note_files`
+    # remembers the signature each note was indexed at, so `sync` only reads
+    # notes that were added or changed since the last run.
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.create_schema()
+
+    def create_schema(self):
+        with self.lock, self.conn:
+            try:
+                self.conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS notes USING fts5(shift_id UNINDEXED, body)")
+                self.fts = True
+            except sqlite3.OperationalError as e:
+                logger.warning(f"SQLite FTS5 unavailable ({e}), notes search will scan.")
+                self.conn.execute("CREATE TABLE IF NOT EXISTS notes (shift_id TEXT, body TEXT)")
+                self.fts = False
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS note_files "
+                "(shift_id TEXT PRIMARY KEY, note_rowid INTEGER, mtime_ns INTEGER, size INTEGER)"
+            )
+
+    def add_note(self, shift_id, body, signature):
+        self.add_notes([(shift_id, body, signature)])
+
+    def add_notes(self, notes):
+        with self.lock, self.conn:
+            for shift_id, body, signature in notes:
+                self.delete_note(shift_id)
+                note_rowid = self.conn.execute(
+                    "INSERT INTO notes (shift_id, body) VALUES (?, ?)", (shift_id, body)
+                ).lastrowid
+                self.conn.execute(
+                    "INSERT INTO note_files (shift_id, note_rowid, mtime_ns, size) VALUES (?, ?, ?, ?)",
+                    (shift_id, note_rowid, *signature),
+                )
+
+    def remove_notes(self, shift_ids):
+        with self.lock, self.conn:
+            for shift_id in shift_ids:
+                self.delete_note(shift_id)
+
+    def delete_note(self, shift_id):
+        # By rowid: `shift_id` is not indexed inside the FTS table.
+        row = self.conn.execute("SELECT note_rowid FROM note_files WHERE shift_id = ?", (shift_id,)).fetchone()
+        if row is not None:
+            self.conn.execute("DELETE FROM notes WHERE rowid = ?", row)
+            self.conn.execute("DELETE FROM note_files WHERE shift_id = ?", (shift_id,))
+
+    def sync(self, note_files, read_archived=None):
+        # `read_archived(shift_id)` returns the bytes of an archived note; it
+        # is only called for archived notes the index has never seen, such
+        # as after notes.db was deleted.
+        with self.lock:
+            indexed = {
+                shift_id: (mtime_ns, size)
+                for shift_id, mtime_ns, size in self.conn.execute("SELECT shift_id, mtime_ns, size FROM note_files")
+            }
+        added = 0
+        batch = []
+        for shift_id, path in note_files:
+            if path is None:
+                # Archived notes never change, so text indexed before they
+                # were archived is kept as it is.
+                if indexed.pop(shift_id, None) is not None or read_archived is None:
+                    continue
+                try:
+                    data = read_archived(shift_id)
+                except Exception as e:
+                    logger.error(f"Failed to index archived note {shift_id}: {e}")
+                    continue
+                body = data.decode("utf-8", errors="replace")
+                signature = (0, len(data))
+            else:
+                signature = file_signature(path)
+                if signature is None or indexed.pop(shift_id, None) == signature:
+                    continue
+                try:
+                    body = Path(path).read_text(encoding="utf-8", errors="replace")
+                except OSError as e:
+                    logger.error(f"Failed to index note {shift_id}: {e}")
+                    continue
+            batch.append((shift_id, body, signature))
+            if len(batch) >= NOTES_INDEX_BATCH_SIZE:
+                self.add_notes(batch)
+                added += len(batch)
+                batch = []
+        if batch:
+            self.add_notes(batch)
+            added += len(batch)
+        self.remove_notes(list(indexed))
+        if added or indexed:
+            logger.info(f"Notes index updated: {added} indexed, {len(indexed)} removed.")
+
+    def search(self, text, limit=NOTES_SEARCH_LIMIT):
+        # Every word must appear, each as a prefix. Returns (shift id,
+        # snippet) pairs, best matches first.
+        words = re.findall(r"\w+", text)
+        if not words:
+            return []
+        with self.lock:
+            if self.fts:
+                query = " ".join(f'"{word}"*' for word in words)
+                rows = self.conn.execute(
+                    "SELECT shift_id, snippet(notes, 1, '[', ']', '...', 12) FROM notes "
+                    "WHERE notes MATCH ? ORDER BY rank LIMIT ?",
+                    (query, limit),
+                ).fetchall()
+            else:
+                where = " AND ".join("body LIKE ?" for _ in words)
+                rows = self.conn.execute(
+                    f"SELECT shift_id, substr(body, 1, 80) FROM notes WHERE {where} LIMIT ?",
+                    (*(f"%{word}%" for word in words), limit),
+                ).fetchall()
+        return [(shift_id, " ".join(snippet.split())) for shift_id, snippet in rows]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def open_sqlite_store(read_only=False):
+    if read_only and not SQLITE_FILE_PATH.exists():
+        # Not migrated yet: read the files the migration would import.
+        return ShiftJournal(DATA_FILE_PATH, JOURNAL_FILE_PATH, read_only=True)
+    return SQLiteShiftStore(SQLITE_FILE_PATH, read_only=read_only)
+
+STORAGE_ENGINES = {
+    "json": lambda read_only=False: JsonShiftStore(DATA_FILE_PATH),
+    "journal": lambda read_only=False: ShiftJournal(DATA_FILE_PATH, JOURNAL_FILE_PATH, read_only=read_only),
+    "sqlite": open_sqlite_store,
+}
+
+def open_storage(engine_name, read_only=False):
+    # read_only stores never compact, migrate or change the schema; only the
+    # GUI instance rewrites the data files.
+    if engine_name not in STORAGE_ENGINES:
+        logger.error(f"Unknown storage engine '{engine_name}', falling back to '{DEFAULT_STORAGE_ENGINE}'.")
+        engine_name = DEFAULT_STORAGE_ENGINE
+    logger.info(f"Using '{engine_name}' storage engine.")
+    return STORAGE_ENGINES[engine_name](read_only=read_only)
+
+def shift_sort_key(shift_id, shift, column):
+    # Parsed values sort first, unparsed strings after them, blanks last.
+    if column == "ID":
+        return (0, int(shift_id)) if shift_id.isdigit() else (1, shift_id)
+    attr = ShiftRecord.FIELDS[column][0]
+    value = getattr(shift, attr)
+    if isinstance(value, str):
+        return (0, value.casefold()) if value else (2, "")
+    if value is not None:
+        return (0, value)
+    raw = shift.get(column)
+    return (1, raw.casefold()) if raw else (2, "")
+
+class SortIndex:
+    # Pre-parsed sort keys for one column, kept as a sorted list of
+    # (key, id key, shift id) so that add, edit and delete are a bisect away
+    # and ties always fall back to the shift id.
+    def __init__(self, column):
+        self.column = column
+        self.entries = []
+        self.keys = {}
+
+    def entry(self, shift_id, shift):
+        return (shift_sort_key(shift_id, shift, self.column), shift_sort_key(shift_id, shift, "ID"), shift_id)
+
+    def rebuild(self, data):
+        self.keys = {shift_id: self.entry(shift_id, shift) for shift_id, shift in data.items()}
+        self.entries = sorted(self.keys.values())
+
+    def update(self, shift_id, old, new):
+        entry = self.keys.pop(shift_id, None)
+        if entry is not None:
+            del self.entries[bisect.bisect_left(self.entries, entry)]
+        if new is not None:
+            entry = self.entry(shift_id, new)
+            bisect.insort(self.entries, entry)
+            self.keys[shift_id] = entry
+
+    def range_entries(self, low=None, high=None, include_low=True, include_high=True):
+        # Bounds are compared against parsed values only. `(0, value)` sorts
+        # before every entry with that key and `(0, value), (3,)` after them.
+        if low is None:
+            start = 0
+        else:
+            start = bisect.bisect_left(self.entries, ((0, low),) if include_low else ((0, low), (3,)))
+        if high is None:
+            end = bisect.bisect_left(self.entries, ((1,),))
+        else:
+            end = bisect.bisect_left(self.entries, ((0, high), (3,)) if include_high else ((0, high),))
+        return self.entries[start:end]
+
+    def range_ids(self, low=None, high=None, include_low=True, include_high=True):
+        return {entry[2] for entry in self.range_entries(low, high, include_low, include_high)}
+
+    def position(self, shift_id, descending=False):
+        position = bisect.bisect_left(self.entries, self.keys[shift_id])
+        return len(self.entries) - 1 - position if descending else position
+
+    def ordered_ids(self, descending=False):
+        entries = reversed(self.entries) if descending else self.entries
+        return [entry[2] for entry in entries]
+
+class ShiftTotals:
+    # Running totals over every shift, adjusted on each change so that the
+    # Totals window never rescans the history. Shifts whose duration or pay
+    # could not be parsed are counted but left out of the sums and listed.
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.hours = 0
+        self.gross = 0
+        self.invalid = {}
+
+    def rebuild(self, data):
+        self.reset()
+        for shift_id, shift in data.items():
+            self.add(shift_id, shift, 1)
+
+    def update(self, shift_id, old, new):
+        if old is not None:
+            self.add(shift_id, old, -1)
+        if new is not None:
+            self.add(shift_id, new, 1)
+
+    def add(self, shift_id, shift, sign):
+        self.count += sign
+        if shift.duration is not None:
+            self.hours += sign * shift.duration
+        if shift.gross is not None:
+            self.gross += sign * shift.gross
+        if sign < 0:
+            self.invalid.pop(shift_id, None)
+        elif shift.duration is None or shift.gross is None:
+            missing = [
+                field
+                for field, value in (("Duration (hrs)", shift.duration), ("Gross pay", shift.gross))
+                if value is None
+            ]
+            self.invalid[shift_id] = missing
+
+class ShiftRollups:
+    # Materialized totals persisted next to the shift data: per day (keyed by
+    # project and model) and per ISO week and month (keyed by project). They
+    # are adjusted on every change, and on load a fingerprint over the fields
+    # they depend on decides whether the saved copy can be trusted.
+    VERSION = 1
+    TABLES = ("day", "week", "month")
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.reset()
+
+    def reset(self):
+        self.tables = {table: {} for table in self.TABLES}
+        self.fingerprint = 0
+
+    @staticmethod
+    def shift_fingerprint(shift_id, shift):
+        key = f"{shift_id}\x1f{shift.date}\x1f{shift.project_id}\x1f{shift.model_id}\x1f{shift.duration}\x1f{shift.gross}"
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def keys(self, shift):
+        if shift.date is None:
+            week = month = "(no date)"
+        else:
+            week, month = iso_week_label(shift.date), month_label(shift.date)
+        return (
+            ("day", (shift.date, shift.project_id, shift.model_id)),
+            ("week", (week, shift.project_id)),
+            ("month", (month, shift.project_id)),
+        )
+
+    def add(self, shift_id, shift, sign):
+        self.fingerprint = (self.fingerprint + sign * self.shift_fingerprint(shift_id, shift)) % 2**64
+        for table, key in self.keys(shift):
+            buckets = self.tables[table]
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = [0, 0, 0]
+            bucket[0] += sign
+            bucket[1] += sign * (shift.duration or 0)
+            bucket[2] += sign * (shift.gross or 0)
+            if bucket[0] == 0:
+                del buckets[key]
+        self.dirty = True
+
+    def update(self, shift_id, old, new):
+        if old is not None:
+            self.add(shift_id, old, -1)
+        if new is not None:
+            self.add(shift_id, new, 1)
+
+    def rebuild(self, data):
+        fingerprint = 0
+        for shift_id, shift in data.items():
+            fingerprint += self.shift_fingerprint(shift_id, shift)
+        if self.load() and self.fingerprint == fingerprint % 2**64:
+            logger.debug("Persisted rollups are consistent with the shift data.")
+            return
+        logger.info("Rebuilding rollups from shift data.")
+        self.reset()
+        for shift_id, shift in data.items():
+            self.add(shift_id, shift, 1)
+
+    def load(self):
+        try:
+            with self.path.open("r") as f:
+                payload = json.load(f)
+            if payload.get("version") != self.VERSION:
+                return False
+            self.tables = {
+                table: {tuple(row[:-3]): list(row[-3:]) for row in payload[table]}
+                for table in self.TABLES
+            }
+            self.fingerprint = payload["fingerprint"]
+            self.dirty = False
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error(f"Failed to read rollups: {e}")
+            return False
+
+    def snapshot(self):
+        self.dirty = False
+        payload = {"version": self.VERSION, "fingerprint": self.fingerprint}
+        for table in self.TABLES:
+            payload[table] = [[*key, *bucket] for key, bucket in self.tables[table].items()]
+        return payload
+
+    def save(self, payload):
+        with self.lock:
+            atomic_write_json(self.path, payload, indent=None)
+
+    def day_rows(self):
+        return ((*key, *bucket) for key, bucket in self.tables["day"].items())
+
+    def period_report(self, table):
+        # Returns (period, shifts, hours, gross, [(project, shifts, hours, gross)])
+        # ordered by period.
+        periods = {}
+        for (period, project_id), bucket in self.tables[table].items():
+            periods.setdefault(period, []).append((project_id or "(none)", *bucket))
+        return [
+            (
+                period,
+                sum(row[1] for row in projects),
+                sum(row[2] for row in projects),
+                sum(row[3] for row in projects),
+                sorted(projects),
+            )
+            for period, projects in sorted(periods.items())
+        ]
+
+def iso_week_label(ordinal):
+    year, week, _ = date.fromordinal(ordinal).isocalendar()
+    return f"{year}-W{week:02d}"
+
+def month_label(ordinal):
+    return date.fromordinal(ordinal).strftime("%Y-%m")
+
+class ShiftAnalytics:
+    # A columnar view of per-day rollup rows: one code array per grouping
+    # dimension plus count, hours and gross arrays, so that grouped totals
+    # are a couple of batched passes (`numpy.bincount` when NumPy is
+    # installed).
+    DIMENSIONS = ("Project ID", "Model ID", "Month", "ISO Week")
+
+    def __init__(self, rows):
+        # `rows` yields (date ordinal, project, model, shifts, hours, gross).
+        load_numpy()
+        self.counts = array("q")
+        self.hours = array("q")
+        self.gross = array("q")
+        self.labels = {dimension: [] for dimension in self.DIMENSIONS}
+        self.codes = {dimension: array("l") for dimension in self.DIMENSIONS}
+        lookups = {dimension: {} for dimension in self.DIMENSIONS}
+        period_labels = {}
+        for ordinal, project_id, model_id, count, hours, gross in rows:
+            self.counts.append(count)
+            self.hours.append(hours)
+            self.gross.append(gross)
+            if ordinal not in period_labels:
+                if ordinal is None:
+                    period_labels[ordinal] = ("(no date)", "(no date)")
+                else:
+                    period_labels[ordinal] = (month_label(ordinal), iso_week_label(ordinal))
+            month, week = period_labels[ordinal]
+            for dimension, label in (
+                ("Project ID", project_id or "(none)"),
+                ("Model ID", model_id or "(none)"),
+                ("Month", month),
+                ("ISO Week", week),
+            ):
+                lookup = lookups[dimension]
+                code = lookup.get(label)
+                if code is None:
+                    code = lookup[label] = len(lookup)
+                    self.labels[dimension].append(label)
+                self.codes[dimension].append(code)
+        self.size = len(self.counts)
+        if numpy is not None:
+            self.counts = numpy.frombuffer(self.counts, dtype=numpy.int64)
+            self.hours = numpy.frombuffer(self.hours, dtype=numpy.int64)
+            self.gross = numpy.frombuffer(self.gross, dtype=numpy.int64)
+            self.codes = {
+                dimension: numpy.frombuffer(codes, dtype=numpy.dtype(f"i{codes.itemsize}")).astype(numpy.intp)
+                for dimension, codes in self.codes.items()
+            }
+
+    def group(self, dimension, rows=None):
+        # Returns (label, shifts, hours, gross, rows) per group, ordered by
+        # label; `rows` restricts the pass to a parent group for drill-down.
+        labels = self.labels[dimension]
+        if numpy is not None:
+            groups = self.group_numpy(dimension, rows)
+        else:
+            groups = self.group_python(dimension, rows)
+        return sorted(
+            ((labels[code], count, hours, gross, group_rows) for code, count, hours, gross, group_rows in groups),
+            key=lambda group: group[0],
+        )
+
+    def group_numpy(self, dimension, rows):
+        if rows is None:
+            rows = numpy.arange(self.size)
+        codes = self.codes[dimension][rows]
+        size = len(self.labels[dimension])
+        row_counts = numpy.bincount(codes, minlength=size)
+        counts = numpy.bincount(codes, weights=self.counts[rows], minlength=size)
+        hours = numpy.bincount(codes, weights=self.hours[rows], minlength=size)
+        gross = numpy.bincount(codes, weights=self.gross[rows], minlength=size)
+        ordered_rows = rows[numpy.argsort(codes, kind="stable")]
+        ends = numpy.cumsum(row_counts)
+        return [
+            (code, int(round(counts[code])), int(round(hours[code])), int(round(gross[code])),
+             ordered_rows[ends[code] - row_counts[code]:ends[code]])
+            for code in numpy.flatnonzero(row_counts)
+        ]
+
+    def group_python(self, dimension, rows):
+        codes = self.codes[dimension]
+        buckets = {}
+        for row in range(self.size) if rows is None else rows:
+            bucket = buckets.get(codes[row])
+            if bucket is None:
+                bucket = buckets[codes[row]] = [0, 0, 0, []]
+            bucket[0] += self.counts[row]
+            bucket[1] += self.hours[row]
+            bucket[2] += self.gross[row]
+            bucket[3].append(row)
+        return [(code, *bucket) for code, bucket in buckets.items()]
+
+def parse_filter_date(value):
+    # Accepts YYYY, YYYY-MM or YYYY-MM-DD and returns the first and last
+    # day ordinals covered.
+    parts = value.split("-")
+    if len(parts) == 1:
+        year = int(parts[0])
+        return date(year, 1, 1).toordinal(), date(year, 12, 31).toordinal()
+    if len(parts) == 2:
+        year, month = int(parts[0]), int(parts[1])
+        first = date(year, month, 1)
+        following = date(year + month // 12, month % 12 + 1, 1)
+        return first.toordinal(), following.toordinal() - 1
+    ordinal = parse_date_ordinal(value)
+    return ordinal, ordinal
+
+def parse_filter_amount(value):
+    amount = parse_hundredths(value)
+    return amount, amount
+
+class ShiftFilter:
+    # A parsed filter bar query. Bare words prefix-match Model ID or Project
+    # ID; `field:value`, `field=value`, `field>value` etc. target one column,
+    # and `a..b` gives a range. Every term is answered by a range lookup in a
+    # SortIndex and the results are intersected.
+    FIELDS = {
+        "model": "Model ID",
+        "project": "Project ID",
+        "date": "Date",
+        "hours": "Duration (hrs)",
+        "rate": "Hourly rate",
+        "pay": "Gross pay",
+        "gross": "Gross pay",
+    }
+    TERM_PATTERN = re.compile(r"^(\w+)(>=|<=|:|=|>|<)(.+)$")
+    PREFIX_END = "\U0010ffff"
+
+    def __init__(self, text):
+        self.text = text
+        self.terms = []
+        self.errors = []
+        for token in text.split():
+            try:
+                self.terms.append(self.parse_term(token))
+            except ValueError:
+                self.errors.append(token)
+
+    def parse_term(self, token):
+        match = self.TERM_PATTERN.match(token)
+        if not match or match.group(1).lower() not in self.FIELDS:
+            value = token.casefold()
+            return (("Model ID", "Project ID"), value, value + self.PREFIX_END, True, False)
+        name, operator, value = match.groups()
+        column = self.FIELDS[name.lower()]
+        if column in ("Model ID", "Project ID"):
+            value = value.casefold()
+            if operator == ":":
+                return ((column,), value, value + self.PREFIX_END, True, False)
+            bounds = lambda v: (v, v)
+        elif column == "Date":
+            bounds = parse_filter_date
+        else:
+            bounds = parse_filter_amount
+        if operator in (":", "=") and ".." in value:
+            low, high = value.split("..", 1)
+            return (
+                (column,),
+                bounds(low)[0] if low else None,
+                bounds(high)[1] if high else None,
+                True,
+                True,
+            )
+        first, last = bounds(value)
+        if operator in (":", "="):
+            return ((column,), first, last, True, True)
+        if operator == ">":
+            return ((column,), last, None, False, True)
+        if operator == ">=":
+            return ((column,), first, None, True, True)
+        if operator == "<":
+            return ((column,), None, first, True, False)
+        return ((column,), None, last, True, True)
+
+    def __bool__(self):
+        return bool(self.terms)
+
+    def matching_ids(self, sort_index):
+        results = []
+        for columns, low, high, include_low, include_high in self.terms:
+            ids = set()
+            for column in columns:
+                ids |= sort_index(column).range_ids(low, high, include_low, include_high)
+            results.append(ids)
+        results.sort(key=len)
+        matched = results[0]
+        for ids in results[1:]:
+            matched = matched & ids
+        return matched
+
+def iter_report_rows(shifts):
+    # Yields the rows of an export: every shift, then totals per project and
+    # model. Only the group totals are held while the shifts stream past.
+    yield ["ID", *DEFAULT_SHIFT_STRUCTURE]
+    groups = {}
+    for shift_id, shift in shifts:
+        yield [shift_id, *(shift.get(field) for field in DEFAULT_SHIFT_STRUCTURE)]
+        bucket = groups.setdefault((shift.project_id, shift.model_id), [0, 0, 0])
+        bucket[0] += 1
+        bucket[1] += shift.duration or 0
+        bucket[2] += shift.gross or 0
+    yield []
+    yield ["Project ID", "Model ID", "Shifts", "Duration (hrs)", "Gross pay"]
+    total = [0, 0, 0]
+    for (project_id, model_id), (count, hours, gross) in sorted(groups.items()):
+        yield [project_id, model_id, count, format_hundredths(hours), format_hundredths(gross)]
+        total[0] += count
+        total[1] += hours
+        total[2] += gross
+    yield ["Total", "", total[0], format_hundredths(total[1]), format_hundredths(total[2])]
+
+def export_format_for_path(path):
+    return "tsv" if Path(path).suffix.lower() in (".tsv", ".tab", ".txt") else "csv"
+
+def export_report(storage, path, export_format=None, start=None, end=None):
+    export_format = export_format or export_format_for_path(path)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, dialect=EXPORT_DIALECTS[export_format])
+        writer.writerows(iter_report_rows(storage.iter_shifts(start, end)))
+    logger.info(f"Exported report to {path}.")
+
+class VirtualShiftTable:
+    # A Treeview that only holds Tk items for the rows in view plus a small
+    # buffer. The scrollbar maps to an offset into `row_ids`, so scrolling and
+    # startup cost the same however many shifts there are.
+    def __init__(self, parent, columns, get_values, buffer_rows=VIRTUAL_TABLE_BUFFER_ROWS):
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=columns, show="headings")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.yview)
+        self.tree.pack(side="left", expand=True, fill="both")
+        self.scrollbar.pack(side="right", fill="y")
+        self.get_values = get_values
+        self.buffer_rows = buffer_rows
+        self.row_ids = []
+        self.positions = None
+        self.offset = 0
+        self.visible_rows = int(self.tree.cget("height"))
+        self.rendered = {}
+        self.selected_id = None
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(3))
+        self.tree.bind("<Up>", lambda event: self.move_selection(-1))
+        self.tree.bind("<Down>", lambda event: self.move_selection(1))
+        self.tree.bind("<Prior>", lambda event: self.move_selection(-self.visible_rows))
+        self.tree.bind("<Next>", lambda event: self.move_selection(self.visible_rows))
+
+    def set_rows(self, row_ids):
+        self.row_ids = row_ids
+        self.positions = None
+        if self.selected_id is None and row_ids:
+            self.selected_id = row_ids[0]
+        self.render()
+
+    def apply_changes(self, changed_ids, data):
+        for shift_id in changed_ids:
+            listed = shift_id in self.rendered or shift_id in self.row_ids
+            if shift_id in data and not listed:
+                self.row_ids.append(shift_id)
+                self.positions = None
+            elif shift_id not in data and listed:
+                self.row_ids.remove(shift_id)
+                self.positions = None
+        if self.selected_id is not None and self.selected_id not in data:
+            self.selected_id = self.row_ids[0] if self.row_ids else None
+        self.render()
+
+    def index_of(self, shift_id):
+        if self.positions is None:
+            self.positions = {row_id: index for index, row_id in enumerate(self.row_ids)}
+        return self.positions.get(shift_id)
+
+    def render(self):
+        self.offset = max(0, min(self.offset, len(self.row_ids) - self.visible_rows))
+        window = self.row_ids[self.offset:self.offset + self.visible_rows + self.buffer_rows]
+        wanted = set(window)
+        for shift_id in [iid for iid in self.rendered if iid not in wanted]:
+            self.tree.delete(shift_id)
+            del self.rendered[shift_id]
+        for index, shift_id in enumerate(window):
+            values = self.get_values(shift_id)
+            if shift_id not in self.rendered:
+                self.tree.insert("", index, iid=shift_id, values=values)
+            else:
+                if self.rendered[shift_id] != values:
+                    self.tree.item(shift_id, values=values)
+                if self.tree.index(shift_id) != index:
+                    self.tree.move(shift_id, "", index)
+            self.rendered[shift_id] = values
+        self.tree.yview_moveto(0)
+        if self.selected_id in wanted:
+            self.tree.selection_set(self.selected_id)
+            self.tree.focus(self.selected_id)
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        total = len(self.row_ids)
+        if total <= self.visible_rows:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + self.visible_rows) / total)
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.row_ids))
+            self.render()
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self.visible_rows
+            self.scroll(amount)
+
+    def scroll(self, amount):
+        self.offset += amount
+        self.render()
+        return "break"
+
+    def on_mouse_wheel(self, event):
+        if platform.system() == "Darwin":
+            return self.scroll(-event.delta)
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def on_resize(self, event):
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        visible_rows = max(1, event.height // row_height - 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.render()
+
+    def on_select(self, event):
+        selection = self.tree.selection()
+        if selection:
+            self.selected_id = selection[0]
+
+    def move_selection(self, step):
+        if not self.row_ids:
+            return "break"
+        index = self.index_of(self.selected_id)
+        index = 0 if index is None else max(0, min(index + step, len(self.row_ids) - 1))
+        self.select(self.row_ids[index])
+        return "break"
+
+    def select(self, shift_id):
+        index = self.index_of(shift_id)
+        if index is None:
+            return
+        self.selected_id = shift_id
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self.visible_rows:
+            self.offset = index - self.visible_rows + 1
+        self.render()
+
+class LogFileIndex:
+    # Line start offsets into a memory-mapped file. The index is built on a
+    # background thread a chunk at a time and extended when the file grows,
+    # so only the lines on screen are ever read and decoded.
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.file = None
+        self.mm = None
+        self.thread = None
+        self.closed = False
+        self.reopen()
+        self.refresh()
+
+    def reopen(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        if self.file is not None:
+            self.file.close()
+        self.file = self.path.open("rb")
+        self.inode = os.fstat(self.file.fileno()).st_ino
+        self.size = 0
+        self.indexed = 0
+        self.offsets = array("q", [0])
+
+    def refresh(self):
+        # Picks up appends, and starts over when the file was truncated or
+        # replaced (log rotation). Returns whether anything changed.
+        with self.lock:
+            if self.closed:
+                return False
+            try:
+                replaced = os.stat(self.path).st_ino != self.inode
+            except FileNotFoundError:
+                replaced = False
+            reset = replaced or os.fstat(self.file.fileno()).st_size < self.size
+            if reset:
+                self.reopen()
+            size = os.fstat(self.file.fileno()).st_size
+            if size == self.size:
+                return reset
+            if self.mm is not None:
+                self.mm.close()
+            self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            self.size = size
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.build, name="LogIndexer", daemon=True)
+            self.thread.start()
+        return True
+
+    def build(self):
+        while True:
+            with self.lock:
+                if self.closed or self.indexed >= self.size:
+                    return
+                end = min(self.indexed + LOG_INDEX_CHUNK, self.size)
+                position = self.indexed
+                while True:
+                    position = self.mm.find(b"\n", position, end)
+                    if position < 0:
+                        break
+                    position += 1
+                    self.offsets.append(position)
+                self.indexed = end
+
+    @property
+    def complete(self):
+        return self.indexed >= self.size
+
+    def count_lines(self):
+        # A trailing line without a newline only counts once indexing caught
+        # up with the end of the file.
+        count = len(self.offsets) - 1
+        if self.indexed >= self.size and self.offsets[-1] < self.size:
+            count += 1
+        return count
+
+    def line_count(self):
+        with self.lock:
+            return self.count_lines()
+
+    def lines(self, start, count):
+        with self.lock:
+            lines = []
+            for line in range(start, min(start + count, self.count_lines())):
+                end = self.offsets[line + 1] if line + 1 < len(self.offsets) else self.size
+                lines.append(self.mm[self.offsets[line]:end].decode("utf-8", errors="replace").rstrip("\r\n"))
+            return lines
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            if self.mm is not None:
+                self.mm.close()
+                self.mm = None
+            self.file.close()
+
+class BytesLineIndex(LogFileIndex):
+    # The same line index over an in-memory buffer, for archived notes.
+    def __init__(self, data):
+        self.lock = threading.Lock()
+        self.thread = None
+        self.closed = False
+        self.mm = data
+        self.size = len(data)
+        self.indexed = 0
+        self.offsets = array("q", [0])
+        self.build()
+
+    def refresh(self):
+        return False
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.mm = None
+
+class PagedLogView:
+    # A read-only Text that only ever holds the page of lines in view. The
+    # scrollbar maps to a line offset in a `LogFileIndex`; in follow mode the
+    # view sticks to the end of the file as lines are appended.
+    def __init__(self, parent):
+        self.frame = ttk.Frame(parent)
+        self.text = Text(self.frame, wrap="none", state="disabled")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.yview)
+        self.text.pack(side="left", expand=True, fill="both")
+        self.scrollbar.pack(side="right", fill="y")
+        self.index = None
+        self.offset = 0
+        self.visible_lines = int(self.text.cget("height"))
+        self.follow = False
+        self.job = None
+        self.shown = None
+
+        self.frame.bind("<Destroy>", lambda event: self.close())
+        self.text.bind("<Configure>", self.on_resize)
+        self.text.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.text.bind("<Button-4>", lambda event: self.scroll(-3))
+        self.text.bind("<Button-5>", lambda event: self.scroll(3))
+        self.text.bind("<Prior>", lambda event: self.scroll(-self.visible_lines))
+        self.text.bind("<Next>", lambda event: self.scroll(self.visible_lines))
+
+    def open(self, path):
+        self.open_index(LogFileIndex(path))
+
+    def open_index(self, index):
+        self.close_index()
+        self.index = index
+        self.offset = 0
+        self.shown = None
+        self.poll()
+
+    def set_follow(self, follow):
+        self.follow = follow
+        self.poll()
+
+    def poll(self):
+        if self.job is not None:
+            self.text.after_cancel(self.job)
+            self.job = None
+        if self.index is None:
+            return
+        if self.follow:
+            self.index.refresh()
+        self.render()
+        if self.follow:
+            self.job = self.text.after(LOG_TAIL_INTERVAL_MS, self.poll)
+        elif not self.index.complete:
+            self.job = self.text.after(LOG_INDEX_POLL_MS, self.poll)
+
+    def render(self):
+        total = self.index.line_count() if self.index else 0
+        last_page = max(0, total - self.visible_lines)
+        self.offset = last_page if self.follow else max(0, min(self.offset, last_page))
+        lines = self.index.lines(self.offset, self.visible_lines) if self.index else []
+        if lines != self.shown:
+            self.shown = lines
+            self.text.configure(state="normal")
+            self.text.delete("1.0", tk.END)
+            self.text.insert("1.0", "\n".join(lines))
+            self.text.configure(state="disabled")
+        if total <= self.visible_lines:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + self.visible_lines) / total)
+
+    def yview(self, *args):
+        total = self.index.line_count() if self.index else 0
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * total)
+            self.render()
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self.visible_lines
+            self.scroll(amount)
+
+    def scroll(self, amount):
+        self.offset += amount
+        self.render()
+        return "break"
+
+    def on_mouse_wheel(self, event):
+        if platform.system() == "Darwin":
+            return self.scroll(-event.delta)
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def on_resize(self, event):
+        line_height = tkfont.Font(font=self.text.cget("font")).metrics("linespace")
+        visible_lines = max(1, event.height // line_height - 1)
+        if visible_lines != self.visible_lines:
+            self.visible_lines = visible_lines
+            self.render()
+
+    def close_index(self):
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+
+    def close(self):
+        if self.job is not None:
+            self.text.after_cancel(self.job)
+            self.job = None
+        self.close_index()
+
+class SingleInstance:
+    # Only one GUI runs per data directory. It holds an exclusive lock on
+    # instance.lock and listens on a local socket (a named pipe on Windows)
+    # whose address and key are published in instance.json; later launches
+    # hand their command to it instead of loading the shifts a second time
+    # and racing it for the data files.
+    def __init__(self, lock_path=INSTANCE_LOCK_PATH, info_path=INSTANCE_INFO_PATH):
+        self.lock_path = Path(lock_path)
+        self.info_path = Path(info_path)
+        self.lock_file = None
+        self.listener = None
+        self.closed = False
+        self.messages = queue.SimpleQueue()
+
+    def acquire(self):
+        lock_file = open(self.lock_path, "a+")
+        try:
+            if platform.system() == "Windows":
+                import msvcrt
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self.lock_file = lock_file
+        return True
+
+    def listen(self):
+        authkey = secrets.token_bytes(32)
+        if platform.system() == "Windows":
+            family = "AF_PIPE"
+            address = rf"\\.\pipe\shyft-{os.getpid()}-{secrets.token_hex(4)}"
+        else:
+            family = "AF_UNIX"
+            address = str(self.lock_path.with_suffix(".sock"))
+            # Left behind by an instance that crashed; the lock says nobody
+            # else is using it.
+            try:
+                os.unlink(address)
+            except FileNotFoundError:
+                pass
+        self.listener = Listener(address, family=family, authkey=authkey)
+        if family == "AF_UNIX":
+            os.chmod(address, 0o600)
+        info = {"pid": os.getpid(), "family": family, "address": address, "authkey": authkey.hex()}
+        atomic_write_json(self.info_path, info, indent=None, private=True)
+        threading.Thread(target=self.serve, name="InstanceListener", daemon=True).start()
+        logger.debug("Listening for other launches on %s.", address)
+
+    def serve(self):
+        while not self.closed:
+            try:
+                connection = self.listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError) as e:
+                if not self.closed:
+                    logger.warning(f"Rejected a connection from another launch: {e}")
+                continue
+            with connection:
+                try:
+                    message = json.loads(connection.recv_bytes(1 << 16))
+                    if isinstance(message, dict):
+                        self.messages.put(message)
+                    connection.send_bytes(b"ok")
+                except (OSError, EOFError, ValueError) as e:
+                    logger.warning(f"Failed to read a command from another launch: {e}")
+
+    @staticmethod
+    def forward(message, info_path=INSTANCE_INFO_PATH, timeout=0.0):
+        # Returns True once a running instance has accepted the message.
+        # With a timeout, keeps retrying while that instance is still
+        # starting its listener.
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with open(info_path, "r") as f:
+                    info = json.load(f)
+                with Client(info["address"], family=info["family"], authkey=bytes.fromhex(info["authkey"])) as connection:
+                    connection.send_bytes(json.dumps(message).encode("utf-8"))
+                    return connection.recv_bytes(16) == b"ok"
+            except (OSError, EOFError, ValueError, KeyError, TypeError, multiprocessing.AuthenticationError):
+                if time.monotonic() >= deadline:
+                    return False
+            time.sleep(0.1)
+
+    def close(self):
+        self.closed = True
+        if self.listener is not None:
+            try:
+                self.listener.close()
+            except OSError:
+                pass
+            self.listener = None
+        if self.lock_file is not None:
+            try:
+                self.info_path.unlink()
+            except FileNotFoundError:
+                pass
+            self.lock_file.close()
+            self.lock_file = None
+
 class ShyftGUI:
-    def __init__(self, root):
+    def __init__(self, root, instance=None):
         self.root = root
+        self.instance = instance
         self.root.title("Shyft")
-        self.time_color = "#A78C7B"
-        self.bg_color = "#FFBE98"
-        self.btn_text_color = "#A78C7B"
-        self.data_file_path = DATA_FILE_PATH
+        self.config = app_config
+        self.time_color = self.config.get("Colors", "time_color", fallback="#A78C7B")
+        self.bg_color = self.config.get("Colors", "bg_color", fallback="#FFBE98")
+        self.btn_text_color = self.config.get("Colors", "btn_text_color", fallback="#A78C7B")
         self.root.configure(bg=self.bg_color)
-        self.config = configparser.ConfigParser()
-        self.config.read(CONFIG_FILE)
-        if not self.config.has_section("Theme"):
-            self.config.add_section("Theme")
         if platform.system() == "Darwin":
-            self.selected_theme = "aqua"
+            default_theme = "aqua"
         else:
-            self.selected_theme = "default"
+            default_theme = "default"
+        self.selected_theme = self.config.get("Theme", "selected", fallback=default_theme)
+        self.default_theme = default_theme
         self.timer_topmost = self.config.getboolean("Theme", "timer_topmost", fallback=False)
         self.timer_topmost_var = tk.BooleanVar(value=self.timer_topmost)
+        self.virtual_table_enabled = self.config.getboolean("View", "virtual_table", fallback=False)
+        self.virtual_table_var = tk.BooleanVar(value=self.virtual_table_enabled)
+        self.progressive_load = self.config.getboolean("View", "progressive_load", fallback=True)
+        self.loading = False
         self.configure_styles()
         self.data = {}
+        self.rendered_shifts = {}
+        self.changed_shift_ids = set()
+        self.totals = ShiftTotals()
+        self.rollups = ShiftRollups(ROLLUPS_FILE_PATH)
+        self.rollup_save_pending = False
+        self.analytics = None
+        self.shift_indexes = [self.totals, self.rollups]
+        self.sort_indexes = {}
+        self.sort_column = None
+        self.sort_descending = False
+        self.shift_filter = None
+        self.shown_ids = None
+        self.storage = open_storage(
+            self.config.get("Storage", "engine", fallback=DEFAULT_STORAGE_ENGINE)
+        )
+        self.writer = StorageWriter(self.storage)
+        self.notes_manifest = NotesManifest(NOTES_DIR)
+        self.notes_index_instance = None
+        self.notes_index_lock = threading.Lock()
+        startup_timer.mark("storage")
+        # Autologger sessions, one per "MODEL / PROJECT" pair, all ticking off
+        # the same scheduler.
+        self.timer_scheduler = TimerScheduler(self.root)
+        self.timer_windows = {}
+        self.notes_windows = {}
+        self.autologger_sessions = {}
+        self.session_checkpoints = SessionCheckpoints(SESSIONS_DIR)
+        self.checkpoint_pending = False
+        self.timer_scheduler.add_listener(self.update_timer_panel)
         self.setup_menu()
+        startup_timer.mark("menus")
         self.create_widgets()
-        self.refresh_view()
-        self.timer_window = None
+        startup_timer.mark("widgets")
+        self.root.after_idle(startup_timer.mark, "first paint")
+        if self.progressive_load:
+            self.start_progressive_load()
+        else:
+            self.refresh_view()
+            self.root.after(0, self.after_data_loaded)
         self.root.resizable(True, False)
         self.root.protocol("WM_DELETE_WINDOW", self.on_quit)
         self.root.bind_all(f"<{modifier_key}-m>", minimize_window)
+        self.config.add_listener(self.on_config_changed)
+        if self.instance is not None:
+            self.root.after(INSTANCE_POLL_INTERVAL_MS, self.poll_instance_messages)
         logger.info("ShyftGUI initialized.")
 
+    def poll_instance_messages(self):
+        # Commands from later launches arrive on the listener thread; they are
+        # run here on the Tk thread, and only once the shifts are loaded.
+        if not self.loading:
+            while True:
+                try:
+                    message = self.instance.messages.get_nowait()
+                except queue.Empty:
+                    break
+                self.handle_instance_message(message)
+        self.root.after(INSTANCE_POLL_INTERVAL_MS, self.poll_instance_messages)
+
+    def handle_instance_message(self, message):
+        command = message.get("command")
+        logger.info(f"Received '{command}' from another launch.")
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
+        if command == "autologger":
+            self.start_autologger(
+                str(message.get("model_id", "")).upper(),
+                str(message.get("project_id", "")).upper(),
+                message.get("hourly_rate"),
+            )
+        elif command != "show":
+            logger.warning(f"Ignoring unknown command '{command}' from another launch.")
+
+    def on_config_changed(self, section, option, value):
+        if (section, option) == ("Theme", "timer_topmost"):
+            topmost_state = self.config.getboolean("Theme", "timer_topmost", fallback=False)
+            for timer_window in self.timer_windows.values():
+                timer_window.root.attributes("-topmost", topmost_state)
+            self.timer_topmost_var.set(topmost_state)
+
     def toggle_timer_topmost(self):
-        if self.timer_window:
-            current_topmost_state = self.timer_window.root.attributes("-topmost")
-            new_topmost_state = not current_topmost_state
-            self.timer_window.root.attributes("-topmost", new_topmost_state)
-            self.config.set("Theme", "timer_topmost", str(new_topmost_state))
-            with open(CONFIG_FILE, "w") as config_file:
-                self.config.write(config_file)
-            self.timer_topmost_var.set(new_topmost_state)
+        if self.timer_windows:
+            new_topmost_state = self.timer_topmost_var.get()
+            self.config.set("Theme", "timer_topmost", new_topmost_state)
             logger.debug(f"Timer topmost state set to {new_topmost_state}.")
 
+    def toggle_virtual_table(self):
+        self.config.set("View", "virtual_table", self.virtual_table_var.get())
+        messagebox.showinfo(
+            "Restart Required", "The table mode will change the next time Shyft starts."
+        )
+        logger.debug(f"Virtual table set to {self.virtual_table_var.get()}.")
+
     def on_quit(self, event=None):
         self.running = False
+        self.save_rollups(background=False)
+        self.checkpoint_sessions()
+        self.writer.close()
+        self.config.flush()
         self.root.destroy()
         logger.info("Application quit.")
 
     def configure_styles(self):
         self.style = ttk.Style(self.root)
         self.update_styles()
+        if self.selected_theme not in self.style.theme_names():
+            logger.warning(f"Theme '{self.selected_theme}' is not available, using '{self.default_theme}'.")
+            self.selected_theme = self.default_theme
         self.style.theme_use(self.selected_theme)
 
     def update_styles(self):
@@ -277,63 +2520,227 @@ class ShyftGUI:
         current_working_directory = os.getcwd()
         if current_working_directory != APP_SUPPORT_DIR:
             os.chdir(APP_SUPPORT_DIR)
+        self.data, rollups = self.read_indexed_data()
+        self.rebuild_indexes(rollups)
+
+    def read_data(self):
         try:
-            if self.data_file_path.exists():
-                with self.data_file_path.open("r") as f:
-                    self.data = json.load(f).get("data", {})
-                    for key in self.data:
-                        for k in DEFAULT_SHIFT_STRUCTURE:
-                            self.data[key].setdefault(k, "")
-                logger.debug(f"Loaded data: {self.data}")
-            else:
-                self.data = {}
-                logger.debug("Data file does not exist. Initialized with empty data.")
+            data = self.writer.overlay(self.storage.load())
+            logger.debug("Loaded %d shifts.", len(data))
+            return data
         except json.JSONDecodeError as e:
             logger.error(f"Error decoding JSON: {e}")
-            self.data = {}
         except Exception as e:
             logger.error(f"Failed to load data file: {e}")
-            self.data = {}
+        return {}
+
+    def read_indexed_data(self):
+        # Safe off the Tk thread: the rollup fingerprint, and the rebuild
+        # when it does not match, are the slow part of a large load.
+        data = self.read_data()
+        rollups = ShiftRollups(ROLLUPS_FILE_PATH)
+        rollups.rebuild(data)
+        return data, rollups
+
+    def start_progressive_load(self):
+        # Parse on a worker thread and feed the table in time-boxed batches,
+        # so the window is usable before the whole history is on screen.
+        self.loading = True
+        self.load_started = time.monotonic()
+        self.load_progress = ttk.Progressbar(self.root, mode="indeterminate")
+        self.load_progress.pack(side="bottom", fill="x", padx=5, pady=(0, 5))
+        self.load_progress.start(10)
+        self.load_results = queue.Queue()
+        threading.Thread(
+            target=lambda: self.load_results.put(self.read_indexed_data()),
+            name="DataLoader",
+            daemon=True,
+        ).start()
+        self.root.after(LOAD_POLL_INTERVAL_MS, self.poll_progressive_load)
+
+    def poll_progressive_load(self):
+        try:
+            data, rollups = self.load_results.get_nowait()
+        except queue.Empty:
+            self.root.after(LOAD_POLL_INTERVAL_MS, self.poll_progressive_load)
+            return
+        self.data = data
+        self.rebuild_indexes(rollups)
+        self.loading = False
+        if self.virtual_table:
+            self.populate_tree()
+            self.finish_progressive_load()
+            return
+        self.load_progress.stop()
+        self.load_progress.configure(mode="determinate", maximum=max(1, len(data)), value=0)
+        self.insert_batch(list(data), 0)
+
+    def insert_batch(self, shift_ids, start):
+        deadline = time.monotonic() + LOAD_BATCH_BUDGET
+        end = start
+        while end < len(shift_ids) and time.monotonic() < deadline:
+            self.sync_tree(shift_ids[end:end + LOAD_BATCH_SIZE])
+            end += LOAD_BATCH_SIZE
+        self.load_progress.configure(value=min(end, len(shift_ids)))
+        if end < len(shift_ids):
+            self.root.after(1, self.insert_batch, shift_ids, end)
+        else:
+            self.finish_progressive_load()
+
+    def finish_progressive_load(self):
+        self.load_progress.destroy()
+        if self.shift_filter or self.sort_column:
+            self.apply_row_order(reorder=bool(self.sort_column))
+        logger.info(
+            f"Loaded {len(self.data)} shifts in {time.monotonic() - self.load_started:.2f}s."
+        )
+        self.after_data_loaded()
 
-    def save_data(self):
-        current_working_directory = os.getcwd()
-        if current_working_directory != APP_SUPPORT_DIR:
-            os.chdir(APP_SUPPORT_DIR)
+    def after_data_loaded(self):
+        startup_timer.mark("data load")
+        startup_timer.report()
+        archive_after_days = self.config.getint(
+            "Notes", "archive_after_days", fallback=DEFAULT_NOTES_ARCHIVE_AFTER_DAYS
+        )
+        threading.Thread(
+            target=self.maintain_notes,
+            args=(dict(self.data), archive_after_days),
+            name="NotesIndexer",
+            daemon=True,
+        ).start()
+        self.offer_session_resume()
+
+    def maintain_notes(self, data, archive_after_days):
         try:
-            with self.data_file_path.open("w") as f:
-                json.dump({"data": self.data}, f, indent=4)
-            self.config.set("Theme", "selected", self.selected_theme)
-            with open(CONFIG_FILE, "w") as config_file:
-                self.config.write(config_file)
-            logger.debug("Data saved successfully.")
-        except Exception as e:
-            logger.error(f"Save Failed: {e}")
-            messagebox.showerror("Save Failed", str(e))
+            self.notes_manifest.migrate(LOGS_DIR, data)
+            self.notes_index().sync(self.notes_manifest.note_files(), self.notes_manifest.read_archived_note)
+            if archive_after_days > 0:
+                self.notes_manifest.archive(date.today() - timedelta(days=archive_after_days))
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Failed to update notes: {e}")
+
+    def data_ready(self):
+        if self.loading:
+            messagebox.showinfo("Loading", "Shifts are still loading. Please try again in a moment.")
+            return False
+        return True
+
+    def record_shift(self, shift_id, shift):
+        self.apply_shift_change(shift_id, shift)
+        return self.persist(self.writer.submit(shift_id, shift))
+
+    def remove_shift(self, shift_id):
+        self.apply_shift_change(shift_id, None)
+        return self.persist(self.writer.submit(shift_id, None))
+
+    def apply_shift_change(self, shift_id, shift):
+        # Every in-memory mutation goes through here so that the indexes
+        # derived from `self.data` stay in step with it.
+        if shift is None:
+            old = self.data.pop(shift_id, None)
+        else:
+            old = self.data.get(shift_id)
+            self.data[shift_id] = shift
+        self.changed_shift_ids.add(shift_id)
+        self.analytics = None
+        for index in self.shift_indexes:
+            index.update(shift_id, old, shift)
+        self.schedule_rollup_save()
+
+    def rebuild_indexes(self, rollups=None):
+        # `rollups` arrives already rebuilt from the loader thread and takes
+        # the place of the current instance; the other indexes are cheap.
+        self.analytics = None
+        if rollups is not None:
+            rollups.lock = self.rollups.lock
+            self.shift_indexes[self.shift_indexes.index(self.rollups)] = rollups
+            self.rollups = rollups
+        for index in self.shift_indexes:
+            if index is not rollups:
+                index.rebuild(self.data)
+        self.schedule_rollup_save()
+
+    def schedule_rollup_save(self):
+        if self.rollups.dirty and not self.rollup_save_pending:
+            self.rollup_save_pending = True
+            self.root.after(ROLLUP_SAVE_DELAY_MS, self.save_rollups)
+
+    def save_rollups(self, background=True):
+        self.rollup_save_pending = False
+        if not self.rollups.dirty:
+            return
+        payload = self.rollups.snapshot()
+        if not background:
+            self.rollups.save(payload)
+            return
+        threading.Thread(target=self.rollups.save, args=(payload,), name="RollupWriter").start()
+
+    def persist(self, future):
+        future.add_done_callback(self.report_save_failure)
+        return future
+
+    def report_save_failure(self, future):
+        error = future.exception()
+        if error is not None:
+            self.root.after(0, lambda: messagebox.showerror("Save Failed", str(error)))
 
     def create_widgets(self):
-        self.tree = ttk.Treeview(
-            self.root,
-            columns=(
-                "ID",
-                "Date",
-                "Model ID",
-                "Project ID",
-                "In (hh:mm)",
-                "Out (hh:mm)",
-                "Duration (hrs)",
-                "Hourly rate",
-                "Gross pay",
-            ),
-            show="headings",
+        filter_frame = ttk.Frame(self.root, style="TFrame")
+        filter_frame.pack(side="top", fill="x", padx=5, pady=(5, 0))
+        ttk.Label(filter_frame, text="Filter:", style="TLabel").pack(side="left")
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", self.apply_filter)
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var, style="TEntry")
+        filter_entry.pack(side="left", expand=True, fill="x", padx=5)
+        filter_entry.bind("<Escape>", self.clear_filter)
+        self.filter_status = ttk.Label(filter_frame, text="", style="TLabel")
+        self.filter_status.pack(side="left")
+
+        columns = (
+            "ID",
+            "Date",
+            "Model ID",
+            "Project ID",
+            "In (hh:mm)",
+            "Out (hh:mm)",
+            "Duration (hrs)",
+            "Hourly rate",
+            "Gross pay",
         )
+        if self.virtual_table_enabled:
+            self.virtual_table = VirtualShiftTable(self.root, columns, self.virtual_row_values)
+            self.tree = self.virtual_table.tree
+            table_widget = self.virtual_table.frame
+        else:
+            self.virtual_table = None
+            self.tree = ttk.Treeview(self.root, columns=columns, show="headings")
+            table_widget = self.tree
         for col in self.tree["columns"]:
-            self.tree.heading(col, text=col, anchor="w")
+            self.tree.heading(col, text=col, anchor="w", command=lambda c=col: self.sort_by(c))
             self.tree.column(col, anchor="w", width=100)
-        self.tree.pack(expand=True, fill="both")
+        table_widget.pack(expand=True, fill="both")
 
         button_frame = ttk.Frame(self.root, style="TFrame")
         button_frame.pack(side="bottom", fill="both", expand=True)
 
+        # Overview of the autologger timers, only shown while any exist.
+        self.timer_panel = ttk.Frame(self.root, style="TFrame")
+        self.timer_panel_anchor = button_frame
+        self.timer_tree = ttk.Treeview(
+            self.timer_panel, columns=("Timer", "Elapsed", "State"), show="headings", height=3
+        )
+        for col, width in (("Timer", 200), ("Elapsed", 100), ("State", 100)):
+            self.timer_tree.heading(col, text=col, anchor="w")
+            self.timer_tree.column(col, anchor="w", width=width)
+        self.timer_tree.pack(side="left", expand=True, fill="x")
+        self.timer_tree.bind("<Double-1>", lambda event: self.switch_to_selected_timer())
+        ttk.Button(
+            self.timer_panel,
+            text="Switch",
+            command=self.switch_to_selected_timer,
+            style="TButton",
+        ).pack(side="left", padx=5)
+
         ttk.Button(
             button_frame,
             text="Manual Entry",
@@ -367,41 +2774,359 @@ class ShyftGUI:
         logger.info("Widgets created.")
 
     def refresh_view(self):
-        self.load_data()
-        self.populate_tree()
+        if not self.data_ready():
+            return
+        try:
+            changes = self.storage.load_changes(self.data)
+        except Exception as e:
+            logger.error(f"Failed to check data file for changes: {e}")
+            self.load_data()
+            self.populate_tree()
+            return
+        if changes is None:
+            logger.debug("Data unchanged on disk; skipping reload.")
+            return
+        pending_ids = self.writer.pending_ids()
+        for shift_id, shift in changes.items():
+            if shift_id not in pending_ids:
+                self.apply_shift_change(shift_id, shift)
+        self.update_tree()
+        logger.debug("Merged %d changed shifts from disk.", len(changes))
 
     def populate_tree(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        for id, shift in self.data.items():
+        if self.virtual_table:
+            self.virtual_table.set_rows(self.row_order())
+            logger.debug("Virtual table populated with data.")
+            return
+        self.sync_tree(self.in_data_order(set(self.data) | set(self.rendered_shifts)))
+        logger.debug("Tree view populated with data.")
+
+    def update_tree(self):
+        changed_ids, self.changed_shift_ids = self.changed_shift_ids, set()
+        if self.virtual_table:
+            if self.sort_column or self.shift_filter:
+                self.apply_row_order()
+            else:
+                self.virtual_table.apply_changes(self.in_data_order(changed_ids), self.data)
+            return
+        self.sync_tree(self.in_data_order(changed_ids))
+        if self.shift_filter:
+            self.apply_row_order(reorder=bool(self.sort_column))
+
+    def in_data_order(self, shift_ids):
+        # Sets iterate in hash order; new rows go in the order the shifts
+        # were recorded, followed by the deleted ids.
+        if len(shift_ids) <= 1:
+            return list(shift_ids)
+        return [shift_id for shift_id in self.data if shift_id in shift_ids] + [
+            shift_id for shift_id in shift_ids if shift_id not in self.data
+        ]
+
+    def row_order(self):
+        if self.shift_filter:
+            matched = self.shift_filter.matching_ids(self.sort_index)
+            if self.sort_column:
+                keys = self.sort_indexes[self.sort_column].keys
+                return sorted(matched, key=keys.__getitem__, reverse=self.sort_descending)
+            # The unfiltered order, so rows that stay shown never move.
+            return [shift_id for shift_id in self.data if shift_id in matched]
+        if self.sort_column:
+            return self.sort_indexes[self.sort_column].ordered_ids(self.sort_descending)
+        return list(self.data)
+
+    def sort_index(self, column):
+        if column not in self.sort_indexes:
+            index = SortIndex(column)
+            index.rebuild(self.data)
+            self.sort_indexes[column] = index
+            self.shift_indexes.append(index)
+        return self.sort_indexes[column]
+
+    def sort_by(self, column):
+        if self.sort_column == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = False
+        self.sort_index(column)
+        for col in self.tree["columns"]:
+            arrow = ""
+            if col == column:
+                arrow = " \u25bc" if self.sort_descending else " \u25b2"
+            self.tree.heading(col, text=col + arrow)
+        self.apply_row_order(reorder=True)
+        logger.debug("Sorted by %s (%s).", column, "descending" if self.sort_descending else "ascending")
+
+    def apply_filter(self, *args):
+        text = self.filter_var.get().strip()
+        self.shift_filter = ShiftFilter(text) if text else None
+        self.apply_row_order()
+        if self.shift_filter is None:
+            self.filter_status.config(text="")
+        elif self.shift_filter.errors:
+            self.filter_status.config(text=f"Invalid: {' '.join(self.shift_filter.errors)}")
+        logger.debug("Filter set to %r.", text)
+
+    def clear_filter(self, event=None):
+        self.filter_var.set("")
+
+    def apply_row_order(self, reorder=False):
+        # Without reorder, rows that stay shown are already in order, so
+        # only rows whose visibility changed are detached or reattached.
+        # Changing the sort passes reorder to move every shown row.
+        ordered = self.row_order()
+        if self.shift_filter and not self.shift_filter.errors:
+            self.filter_status.config(text=f"{len(ordered)} of {len(self.data)} shifts")
+        if self.virtual_table:
+            self.virtual_table.set_rows(ordered)
+            return
+        ordered = [shift_id for shift_id in ordered if shift_id in self.rendered_shifts]
+        wanted = set(ordered)
+        shown = self.shown_ids if self.shown_ids is not None else set(self.rendered_shifts)
+        for shift_id in shown - wanted:
+            self.tree.detach(shift_id)
+        self.shown_ids = wanted if self.shift_filter else None
+        if reorder:
+            for position, shift_id in enumerate(ordered):
+                self.tree.move(shift_id, "", position)
+            return
+        # Reattaching in display order puts each row after the ones already
+        # shown before it.
+        reattached = wanted - shown
+        if reattached:
+            for position, shift_id in enumerate(ordered):
+                if shift_id in reattached:
+                    self.tree.move(shift_id, "", position)
+
+    def sync_tree(self, shift_ids):
+        # Only rows whose record differs from the one last rendered touch Tk.
+        updated = deleted = 0
+        inserts = []
+        for shift_id in shift_ids:
+            shift = self.data.get(shift_id)
+            rendered = self.rendered_shifts.get(shift_id)
+            if shift is None:
+                if rendered is not None:
+                    self.tree.delete(shift_id)
+                    del self.rendered_shifts[shift_id]
+                    if self.shown_ids is not None:
+                        self.shown_ids.discard(shift_id)
+                    deleted += 1
+            elif rendered is None:
+                inserts.append(shift_id)
+            elif rendered is not shift and rendered != shift:
+                self.tree.item(shift_id, values=self.tree_values(shift_id, shift))
+                if self.sort_column:
+                    self.tree.move(shift_id, "", self.tree_position(shift_id))
+                self.rendered_shifts[shift_id] = shift
+                updated += 1
+            else:
+                self.rendered_shifts[shift_id] = shift
+        if self.sort_column:
+            # In ascending position order every row sorted before the one
+            # being inserted is already in the tree, so its index is exact.
+            inserts.sort(key=self.tree_position)
+        for shift_id in inserts:
+            shift = self.data[shift_id]
             self.tree.insert(
                 "",
-                "end",
-                iid=id,
-                values=(
-                    id,
-                    shift.get("Date", "N/A"),
-                    shift.get("Model ID", "N/A"),
-                    shift.get("Project ID", "N/A"),
-                    shift.get("In (hh:mm)", "N/A"),
-                    shift.get("Out (hh:mm)", "N/A"),
-                    shift.get("Duration (hrs)", "N/A"),
-                    shift.get("Hourly rate", "N/A"),
-                    shift.get("Gross pay", "N/A"),
-                ),
+                self.tree_position(shift_id),
+                iid=shift_id,
+                values=self.tree_values(shift_id, shift),
             )
-        first_item = self.tree.get_children()
-        if (first_item):
-            self.tree.selection_set(first_item[0])
-            self.tree.focus(first_item[0])
-        logger.debug("Tree view populated with data.")
+            self.rendered_shifts[shift_id] = shift
+            if self.shown_ids is not None:
+                self.shown_ids.add(shift_id)
+        inserted = len(inserts)
+        if not self.tree.selection():
+            first_item = self.tree.get_children()
+            if first_item:
+                self.tree.selection_set(first_item[0])
+                self.tree.focus(first_item[0])
+        logger.debug("Tree view synced: %d inserted, %d updated, %d deleted.", inserted, updated, deleted)
+
+    def tree_position(self, shift_id):
+        if self.sort_column:
+            return self.sort_indexes[self.sort_column].position(shift_id, self.sort_descending)
+        return "end"
+
+    def tree_values(self, shift_id, shift):
+        return (shift_id, *(shift.get(field, "N/A") for field in DEFAULT_SHIFT_STRUCTURE))
+
+    def virtual_row_values(self, shift_id):
+        return self.tree_values(shift_id, self.data[shift_id])
+
+    def notes_index(self):
+        # Opened on first use, usually by the background notes pass after
+        # the shifts have loaded.
+        with self.notes_index_lock:
+            if self.notes_index_instance is None:
+                self.notes_index_instance = NotesIndex(NOTES_INDEX_PATH)
+            return self.notes_index_instance
+
+    def index_note(self, shift_id, notes, path):
+        def run():
+            try:
+                self.notes_index().add_note(shift_id, notes, file_signature(path))
+            except sqlite3.Error as e:
+                logger.error(f"Failed to index note {shift_id}: {e}")
 
-    def calculate_totals(self, event=None):
-        number_of_shifts = len(self.data.values())
-        total_hours_worked = sum(
-            float(shift["Duration (hrs)"]) for shift in self.data.values()
+        threading.Thread(target=run, name="NotesIndexer", daemon=True).start()
+
+    def show_shift(self, shift_id):
+        # Selects a shift in the table, clearing a filter that hides it.
+        if shift_id not in self.data:
+            messagebox.showinfo("Not Found", f"Shift {shift_id} is no longer in the table.")
+            return
+        if self.shift_filter and shift_id not in self.shift_filter.matching_ids(self.sort_index):
+            self.clear_filter()
+        if self.virtual_table:
+            self.virtual_table.select(shift_id)
+        elif self.tree.exists(shift_id):
+            self.tree.selection_set(shift_id)
+            self.tree.focus(shift_id)
+            self.tree.see(shift_id)
+        self.root.lift()
+        self.root.focus_force()
+
+    def search_notes(self, event=None):
+        if not self.data_ready():
+            return
+        search_window = tk.Toplevel(self.root)
+        search_window.title("Search Notes")
+        search_window.geometry("640x400")
+        search_window.bind("<Command-w>", close_current_window)
+        search_window.bind("<Command-W>", close_current_window)
+
+        query_var = tk.StringVar()
+        query_entry = ttk.Entry(search_window, textvariable=query_var, style="TEntry")
+        query_entry.pack(fill="x", padx=10, pady=(10, 5))
+        query_entry.focus_set()
+        status = ttk.Label(search_window, text="", style="TLabel")
+        status.pack(anchor="w", padx=10)
+
+        columns = ("ID", "Date", "Project ID", "Match")
+        results_tree = ttk.Treeview(search_window, columns=columns, show="headings")
+        for col, width in zip(columns, (60, 90, 90, 400)):
+            results_tree.heading(col, text=col, anchor="w")
+            results_tree.column(col, anchor="w", width=width, stretch=col == "Match")
+        results_tree.pack(expand=True, fill="both", padx=10, pady=(5, 10))
+
+        pending = []
+
+        def run_search():
+            pending.clear()
+            results_tree.delete(*results_tree.get_children())
+            query = query_var.get()
+            try:
+                hits = self.notes_index().search(query)
+            except sqlite3.Error as e:
+                status.config(text=f"Invalid search: {e}")
+                return
+            for shift_id, snippet in hits:
+                shift = self.data.get(shift_id)
+                results_tree.insert(
+                    "",
+                    "end",
+                    iid=shift_id,
+                    values=(
+                        shift_id,
+                        shift.get("Date") if shift else "",
+                        shift.get("Project ID") if shift else "(deleted)",
+                        snippet,
+                    ),
+                )
+            status.config(text=f"{len(hits)} notes" if query.strip() else "")
+
+        def schedule_search(*args):
+            # Waits for a pause in typing before querying.
+            for job in pending:
+                search_window.after_cancel(job)
+            pending[:] = [search_window.after(150, run_search)]
+
+        def open_result(event=None):
+            selected = results_tree.selection()
+            if selected:
+                self.show_shift(selected[0])
+
+        query_var.trace_add("write", schedule_search)
+        results_tree.bind("<Double-1>", open_result)
+        results_tree.bind("<Return>", open_result)
+        logger.debug("Notes search window displayed.")
+
+    def selected_shift_id(self):
+        if self.virtual_table:
+            return self.virtual_table.selected_id
+        selected_item = self.tree.selection()
+        return selected_item[0] if selected_item else None
+
+    def export_report_dialog(self, event=None):
+        if not self.data_ready():
+            return
+        bounds = []
+        for label in ("Start", "End"):
+            value = simpledialog.askstring(
+                "Export Report",
+                f"{label} date (YYYY, YYYY-MM or YYYY-MM-DD, blank for no limit):",
+                parent=self.root,
+            )
+            if value is None:
+                return
+            try:
+                bounds.append(parse_filter_date(value.strip()) if value.strip() else None)
+            except ValueError:
+                messagebox.showerror("Error", f"Invalid date: {value}")
+                return
+        start = bounds[0][0] if bounds[0] else None
+        end = bounds[1][1] if bounds[1] else None
+        path = filedialog.asksaveasfilename(
+            parent=self.root,
+            title="Export Report",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("TSV", "*.tsv")],
         )
-        total_gross_pay = sum(float(shift["Gross pay"]) for shift in self.data.values())
+        if not path:
+            return
+
+        date_index = self.sort_index("Date")
+        if start is None and end is None:
+            shift_ids = date_index.ordered_ids()
+        else:
+            shift_ids = [entry[2] for entry in date_index.range_entries(start, end)]
+        try:
+            f = open(path, "w", newline="", encoding="utf-8")
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to export report: {e}")
+            return
+        writer = csv.writer(f, dialect=EXPORT_DIALECTS[export_format_for_path(path)])
+        # Shifts deleted while the export is running are skipped.
+        shifts = ((shift_id, self.data[shift_id]) for shift_id in shift_ids if shift_id in self.data)
+        self.write_export_batch(f, writer, iter_report_rows(shifts))
+
+    def write_export_batch(self, f, writer, rows):
+        deadline = time.monotonic() + LOAD_BATCH_BUDGET
+        try:
+            while time.monotonic() < deadline:
+                batch = list(itertools.islice(rows, EXPORT_BATCH_SIZE))
+                writer.writerows(batch)
+                if len(batch) < EXPORT_BATCH_SIZE:
+                    f.close()
+                    logger.info(f"Exported report to {f.name}.")
+                    messagebox.showinfo("Export Report", f"Report saved to {f.name}.")
+                    return
+        except OSError as e:
+            f.close()
+            logger.error(f"Failed to export report: {e}")
+            messagebox.showerror("Error", f"Failed to export report: {e}")
+            return
+        self.root.after(1, self.write_export_batch, f, writer, rows)
+
+    def calculate_totals(self, event=None):
+        if not self.data_ready():
+            return
+        number_of_shifts = self.totals.count
+        total_hours_worked = self.totals.hours / 100
+        total_gross_pay = self.totals.gross / 100
         tax_liability = total_gross_pay * 0.27
         net_income = total_gross_pay - tax_liability
 
@@ -431,6 +3156,23 @@ class ShyftGUI:
         totals_tree.insert(
             "", "end", values=("Estimated Net Income", f"${net_income:.2f}")
         )
+        if self.totals.invalid:
+            invalid_ids = sorted(self.totals.invalid)
+            totals_tree.insert(
+                "", "end", values=("Shifts Excluded (invalid values)", len(invalid_ids))
+            )
+            for shift_id in invalid_ids[:20]:
+                totals_tree.insert(
+                    "",
+                    "end",
+                    values=(f"  {shift_id}", ", ".join(self.totals.invalid[shift_id])),
+                )
+            if len(invalid_ids) > 20:
+                totals_tree.insert("", "end", values=("  ...", f"{len(invalid_ids) - 20} more"))
+            logger.warning(f"Totals exclude shifts with invalid values: {', '.join(invalid_ids)}")
+
+        self.create_breakdown(totals_window)
+        self.create_period_report(totals_window)
 
         def on_close():
             totals_window.destroy()
@@ -441,6 +3183,109 @@ class ShyftGUI:
         totals_window.wait_window()
         logger.debug("Totals window displayed.")
 
+    def create_breakdown(self, window):
+        if self.analytics is None:
+            self.analytics = ShiftAnalytics(self.rollups.day_rows())
+        analytics = self.analytics
+
+        controls = ttk.Frame(window, style="TFrame")
+        controls.pack(fill="x", padx=5, pady=(10, 5))
+        ttk.Label(controls, text="Group by:", style="TLabel").pack(side="left")
+        dimension_var = tk.StringVar(value=ShiftAnalytics.DIMENSIONS[0])
+        ttk.Combobox(
+            controls,
+            textvariable=dimension_var,
+            values=ShiftAnalytics.DIMENSIONS,
+            state="readonly",
+            width=12,
+        ).pack(side="left", padx=5)
+
+        columns = ("Shifts", "Hours", "Gross pay", "Effective rate")
+        breakdown_tree = ttk.Treeview(window, columns=columns, show="tree headings", height=12)
+        breakdown_tree.heading("#0", text="Group", anchor="w")
+        breakdown_tree.column("#0", anchor="w", width=200)
+        for col in columns:
+            breakdown_tree.heading(col, text=col, anchor="e")
+            breakdown_tree.column(col, anchor="e", width=100)
+        breakdown_tree.pack(expand=True, fill="both")
+
+        # Children are only computed when a group is first opened.
+        pending_children = {}
+
+        def insert_groups(parent, dimensions, rows):
+            dimension, remaining = dimensions[0], dimensions[1:]
+            for label, count, hours, gross, group_rows in analytics.group(dimension, rows):
+                rate = f"${gross / hours:.2f}" if hours else "N/A"
+                item = breakdown_tree.insert(
+                    parent,
+                    "end",
+                    text=f"{dimension}: {label}",
+                    values=(count, f"{hours / 100:.2f}", f"${gross / 100:.2f}", rate),
+                )
+                if remaining:
+                    breakdown_tree.insert(item, "end")
+                    pending_children[item] = (remaining, group_rows)
+
+        def on_open(event):
+            item = breakdown_tree.focus()
+            if item in pending_children:
+                remaining, rows = pending_children.pop(item)
+                breakdown_tree.delete(*breakdown_tree.get_children(item))
+                insert_groups(item, remaining, rows)
+
+        def show(*args):
+            breakdown_tree.delete(*breakdown_tree.get_children())
+            pending_children.clear()
+            first = dimension_var.get()
+            dimensions = (first,) + tuple(d for d in ShiftAnalytics.DIMENSIONS if d != first)
+            insert_groups("", dimensions, None)
+
+        breakdown_tree.bind("<<TreeviewOpen>>", on_open)
+        dimension_var.trace_add("write", show)
+        show()
+
+    def create_period_report(self, window):
+        periods = {"Week": "week", "Month": "month"}
+        controls = ttk.Frame(window, style="TFrame")
+        controls.pack(fill="x", padx=5, pady=(10, 5))
+        ttk.Label(controls, text="Totals per:", style="TLabel").pack(side="left")
+        period_var = tk.StringVar(value="Week")
+        ttk.Combobox(
+            controls,
+            textvariable=period_var,
+            values=tuple(periods),
+            state="readonly",
+            width=12,
+        ).pack(side="left", padx=5)
+
+        columns = ("Shifts", "Hours", "Gross pay", "Effective rate")
+        period_tree = ttk.Treeview(window, columns=columns, show="tree headings", height=8)
+        period_tree.heading("#0", text="Period", anchor="w")
+        period_tree.column("#0", anchor="w", width=200)
+        for col in columns:
+            period_tree.heading(col, text=col, anchor="e")
+            period_tree.column(col, anchor="e", width=100)
+        period_tree.pack(expand=True, fill="both")
+
+        def values(count, hours, gross):
+            rate = f"${gross / hours:.2f}" if hours else "N/A"
+            return (count, f"{hours / 100:.2f}", f"${gross / 100:.2f}", rate)
+
+        def show(*args):
+            period_tree.delete(*period_tree.get_children())
+            for period, count, hours, gross, projects in self.rollups.period_report(periods[period_var.get()]):
+                item = period_tree.insert("", "end", text=period, values=values(count, hours, gross))
+                for project_id, project_count, project_hours, project_gross in projects:
+                    period_tree.insert(
+                        item,
+                        "end",
+                        text=f"Project ID: {project_id}",
+                        values=values(project_count, project_hours, project_gross),
+                    )
+
+        period_var.trace_add("write", show)
+        show()
+
     def view_logs(self, event=None):
         os.chdir(LOGS_DIR)
         log_window = tk.Toplevel(self.root)
@@ -453,7 +3298,7 @@ class ShyftGUI:
         tree_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
 
         log_tree = ttk.Treeview(
-            tree_frame, columns=["Log Files"], show="headings", height=4
+            tree_frame, columns=["Log Files"], show="headings", height=3
         )
         log_tree.heading("Log Files", text="Log Files")
         log_tree.column("Log Files", anchor="w")
@@ -461,6 +3306,8 @@ class ShyftGUI:
 
         log_tree.tag_configure("highlight", background="#FFBE98")
 
+        # Notes are in their own shards now, so this only lists app.log and
+        # its rotations.
         log_files = sorted(
             [
                 f
@@ -472,10 +3319,44 @@ class ShyftGUI:
         for log_file in log_files:
             log_tree.insert("", "end", iid=log_file.name, values=[log_file.name])
 
-        text_frame = ttk.Frame(log_window)
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(5, 10))
-        text_widget = Text(text_frame, wrap="word")
-        text_widget.pack(fill=tk.BOTH, expand=True)
+        # The notes list pages through the manifest and only ever holds the
+        # rows in view.
+        notes = self.notes_manifest.load()
+        notes_table = VirtualShiftTable(
+            log_window,
+            ("Note", "Date", "Project ID", "Size"),
+            lambda shift_id: (
+                shift_id,
+                notes[shift_id]["date"],
+                notes[shift_id]["project"],
+                notes[shift_id]["size"],
+            ),
+        )
+        notes_table.tree.configure(height=6)
+        notes_table.visible_rows = 6
+        for col in notes_table.tree["columns"]:
+            notes_table.tree.heading(col, text=col, anchor="w")
+            notes_table.tree.column(col, anchor="w", width=100)
+        notes_table.frame.pack(fill=tk.X, padx=10, pady=5)
+        notes_table.set_rows(sorted(notes, key=lambda shift_id: shift_sort_key(shift_id, None, "ID")))
+
+        follow_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            log_window,
+            text="Follow new lines (tail -f)",
+            variable=follow_var,
+            command=lambda: log_view.set_follow(follow_var.get()),
+        ).pack(anchor="w", padx=10)
+
+        log_view = PagedLogView(log_window)
+        log_view.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(5, 10))
+
+        def open_in_view(name, path):
+            try:
+                log_view.open(path)
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to open {name}: {e}")
+                logger.error(f"Failed to open log file {name}: {e}")
 
         def on_log_selection(event):
             for item in log_tree.get_children():
@@ -484,16 +3365,33 @@ class ShyftGUI:
             selected_item = log_tree.selection()
             if selected_item:
                 log_tree.item(selected_item[0], tags=("highlight",))
-
-                log_file_path = os.path.join(LOGS_DIR, selected_item[0])
-                with open(log_file_path, "r") as file:
-                    content = file.read()
-                text_widget.delete("1.0", tk.END)
-                text_widget.insert("1.0", content)
+                open_in_view(selected_item[0], os.path.join(LOGS_DIR, selected_item[0]))
+
+        opened_note = [None]
+
+        def on_note_selection(event):
+            # The table re-selects its row on every scroll; only open a note
+            # when the selection actually moved.
+            selected_item = notes_table.tree.selection()
+            if selected_item and selected_item[0] != opened_note[0]:
+                opened_note[0] = selected_item[0]
+                for item in log_tree.get_children():
+                    log_tree.item(item, tags=())
+                entry = notes[selected_item[0]]
+                if "archive" in entry:
+                    try:
+                        log_view.open_index(BytesLineIndex(self.notes_manifest.read_archived(entry)))
+                    except (OSError, EOFError, gzip.BadGzipFile) as e:
+                        messagebox.showerror("Error", f"Failed to read archived note {selected_item[0]}: {e}")
+                        logger.error(f"Failed to read archived note {selected_item[0]}: {e}")
+                else:
+                    open_in_view(f"{selected_item[0]}.md", NOTES_DIR / entry["path"])
 
         log_tree.bind("<<TreeviewSelect>>", on_log_selection)
+        notes_table.tree.bind("<<TreeviewSelect>>", on_note_selection, add="+")
 
         def on_close():
+            log_view.close()
             log_window.destroy()
             self.root.focus_force()  # Return focus to the main window
 
@@ -539,6 +3437,8 @@ class ShyftGUI:
 
             try:
                 hourly_rate = float(new_data["Hourly rate"])
+                if not math.isfinite(hourly_rate):
+                    raise ValueError(hourly_rate)
                 new_data["Hourly rate"] = "{:.2f}".format(hourly_rate)
             except ValueError:
                 messagebox.showerror(
@@ -550,11 +3450,8 @@ class ShyftGUI:
             gross_pay = hourly_rate * duration_hrs
             new_data["Gross pay"] = "{:.2f}".format(gross_pay)
 
-            lock = threading.Lock()
-            with lock:
-                self.data[formatted_id] = new_data
-                self.save_data()
-            self.root.after(0, self.populate_tree)  # This will refresh the tree and select the first item
+            self.record_shift(formatted_id, ShiftRecord.from_dict(new_data))
+            self.update_tree()
             self.entries["window"].destroy()
             messagebox.showinfo("Success", "Shift logged successfully.")
             self.root.focus_force()
@@ -562,9 +3459,10 @@ class ShyftGUI:
         except ValueError as e:
             messagebox.showerror("Error", str(e))
             logger.error(f"Shift logging failed: {e}")
-        self.refresh_view()  # This will call populate_tree again, ensuring the first item is selected
 
     def manual_entry(self, event=None):
+        if not self.data_ready():
+            return
         window = tk.Toplevel(self.root)
         window.title("Manual Entry")
         window.bind(f"<{modifier_key}-w>", close_current_window)
@@ -615,11 +3513,12 @@ class ShyftGUI:
         logger.debug("Manual entry window displayed.")
 
     def edit_shift(self, event=None):
-        selected_item = self.tree.selection()
-        if not selected_item:
+        if not self.data_ready():
+            return
+        selected_id = self.selected_shift_id()
+        if selected_id is None:
             messagebox.showerror("Error", "Please select a shift to edit.")
             return
-        selected_id = selected_item[0]
         shift = self.data.get(selected_id)
 
         window = tk.Toplevel(self.root)
@@ -694,14 +3593,8 @@ class ShyftGUI:
             updated_data["Hourly rate"] = f"{float(updated_data['Hourly rate']):.2f}"
             updated_data["Gross pay"] = f"{float(updated_data['Gross pay']):.2f}"
 
-            lock = threading.Lock()
-            with lock:
-                self.data[selected_id] = updated_data
-
-            save_thread = threading.Thread(
-                target=lambda: self.save_and_update_view(root)
-            )
-            save_thread.start()
+            self.record_shift(selected_id, ShiftRecord.from_dict(updated_data))
+            self.update_tree()
             root.destroy()
             messagebox.showinfo("Success", "Data updated successfully.")
             self.root.focus_force()
@@ -710,46 +3603,26 @@ class ShyftGUI:
             messagebox.showerror("Error", "Failed to update shift. Error: " + str(e))
             logger.error(f"Failed to update shift: {e}")
 
-    def save_and_update_view(self, window):
-        try:
-            self.save_data()
-            self.root.after(0, self.populate_tree)
-            window.destroy()
-        except Exception as e:
-            messagebox.showerror(
-                "Error", "Failed to save and update view. Error: " + str(e)
-            )
-            logger.error(f"Failed to save and update view: {e}")
-
     def delete_shift(self, event=None):
-        selected_item = self.tree.selection()
-        if not selected_item:
+        if not self.data_ready():
+            return
+        selected_id = self.selected_shift_id()
+        if selected_id is None:
             messagebox.showerror("Error", "Please select a shift to delete.")
             return
-        selected_id = selected_item[0]
         response = messagebox.askyesno(
             "Confirm Delete", "Are you sure you want to delete the selected shift?"
         )
         if response:
-            del self.data[selected_id]
-            self.save_data()
-            self.populate_tree()
+            self.remove_shift(selected_id)
+            self.update_tree()
             self.root.focus_force()
             logger.info(f"Shift {selected_id} deleted.")
 
-    def save_data_and_update_view(self, notes_window):
+    def update_view_after_autologger(self, timer_name):
         try:
-            self.save_data()
-            self.populate_tree()
-            notes_window.destroy()
-
-            if self.timer_window:
-                self.timer_window.reset()
-                self.timer_window.on_close()
-                self.timer_window = None
-                self.enable_theme_menu()
-                self.disable_topmost_menu()
-
+            self.update_tree()
+            self.close_timer(timer_name)
             self.root.focus_force()
             logger.info("Data saved and view updated.")
 
@@ -757,19 +3630,183 @@ class ShyftGUI:
             messagebox.showerror("Error", f"Failed to log shift: {str(e)}")
             logger.error(f"Failed to log shift: {e}")
 
+    def open_timer_window(self, name):
+        timer_window = TimerWindow(
+            tk.Toplevel(self.root),
+            time_color=self.time_color,
+            bg_color=self.bg_color,
+            scheduler=self.timer_scheduler,
+            name=name,
+        )
+        timer_window.root.protocol("WM_DELETE_WINDOW", lambda: self.close_timer_window(name))
+        topmost_state = self.config.getboolean("Theme", "timer_topmost", fallback=False)
+        timer_window.root.attributes("-topmost", topmost_state)
+        self.timer_windows[name] = timer_window
+        return timer_window
+
     def reinitialize_timer_window(self):
-        if self.timer_window:
-            self.timer_window.on_close()
-            self.timer_window = TimerWindow(
-                tk.Toplevel(self.root), time_color=self.time_color, bg_color=self.bg_color
+        for name, old_window in list(self.timer_windows.items()):
+            running = old_window.running
+            old_window.on_close()
+            timer_window = self.open_timer_window(name)
+            timer_window.elapsed_time = old_window.elapsed_time
+            timer_window.refresh(timer_window.elapsed_time.total_seconds())
+            if running:
+                timer_window.start()
+        self.update_timer_panel()
+        logger.info("Timer windows reinitialized with new settings.")
+
+    def switch_timer(self, name):
+        # Starting one timer pauses every other one.
+        for other_name, timer_window in self.timer_windows.items():
+            if other_name != name:
+                timer_window.stop()
+        timer_window = self.timer_windows[name]
+        timer_window.start()
+        timer_window.root.lift()
+        notes_window = self.notes_windows.get(name)
+        if notes_window is not None and notes_window.winfo_exists():
+            notes_window.lift()
+            notes_window.focus_force()
+        logger.debug("Switched to timer %s.", name)
+
+    def focus_session(self, name):
+        if name in self.timer_windows:
+            self.switch_timer(name)
+            return
+        notes_window = self.notes_windows.get(name)
+        if notes_window is not None and notes_window.winfo_exists():
+            notes_window.lift()
+            notes_window.focus_force()
+
+    def switch_to_selected_timer(self):
+        selected = self.timer_tree.selection()
+        if selected and selected[0] in self.timer_windows:
+            self.switch_timer(selected[0])
+
+    def close_timer(self, name):
+        self.autologger_sessions.pop(name, None)
+        self.session_checkpoints.discard(name)
+        timer_window = self.timer_windows.pop(name, None)
+        if timer_window is not None:
+            timer_window.reset()
+            timer_window.on_close()
+        notes_window = self.notes_windows.pop(name, None)
+        if notes_window is not None and notes_window.winfo_exists():
+            notes_window.destroy()
+        if not self.timer_windows:
+            self.enable_theme_menu()
+            self.disable_topmost_menu()
+        self.update_timer_panel()
+
+    def close_timer_window(self, name):
+        # Closing only the timer leaves its notes open, as before; submitting
+        # them then reports that the timer is not running. The session keeps
+        # the time logged so far, so its checkpoint still has it.
+        timer_window = self.timer_windows.pop(name, None)
+        if timer_window is not None:
+            session = self.autologger_sessions.get(name)
+            if session is not None:
+                session["elapsed"] = timer_window.current_elapsed().total_seconds()
+            timer_window.on_close()
+        if not self.timer_windows:
+            self.enable_theme_menu()
+            self.disable_topmost_menu()
+        self.update_timer_panel()
+
+    def schedule_checkpoint(self):
+        if self.autologger_sessions and not self.checkpoint_pending:
+            self.checkpoint_pending = True
+            self.root.after(CHECKPOINT_INTERVAL_MS, self.checkpoint_sessions)
+
+    def checkpoint_sessions(self):
+        # Notes are only read back from the widget when Tk flagged an edit,
+        # and files are only rewritten when their contents changed.
+        self.checkpoint_pending = False
+        for name, session in self.autologger_sessions.items():
+            text = session["text"]
+            if text.winfo_exists() and text.edit_modified():
+                session["notes"] = text.get("1.0", "end-1c")
+                text.edit_modified(False)
+            timer_window = self.timer_windows.get(name)
+            if timer_window is None:
+                elapsed, running = session.get("elapsed", 0), False
+            else:
+                elapsed, running = timer_window.current_elapsed().total_seconds(), timer_window.running
+            try:
+                self.session_checkpoints.save(name, {
+                    "model_id": session["model_id"],
+                    "project_id": session["project_id"],
+                    "hourly_rate": session["hourly_rate"],
+                    "elapsed": int(elapsed),
+                    "running": running,
+                    "notes": session["notes"],
+                })
+            except OSError as e:
+                logger.error(f"Failed to checkpoint timer {name}: {e}")
+        self.schedule_checkpoint()
+
+    def offer_session_resume(self):
+        # A command from another launch may already have opened one of these
+        # timers; that session is live and keeps its own checkpoint.
+        sessions = [
+            session for session in self.session_checkpoints.load_all()
+            if f"{session['model_id']} / {session['project_id']}" not in self.autologger_sessions
+        ]
+        if not sessions:
+            return
+        summary = "\n".join(
+            f"{session['model_id']} / {session['project_id']}: {format_elapsed(session['elapsed'])}"
+            f" (last saved {session['checkpointed_at']})"
+            for session in sessions
+        )
+        if not messagebox.askyesno(
+            "Resume Session",
+            f"These autologger timers were still open when Shyft last closed:\n\n{summary}\n\nResume them?",
+        ):
+            for session in sessions:
+                # The prompt runs the event loop, so a launch may have opened
+                # one of these meanwhile.
+                name = f"{session['model_id']} / {session['project_id']}"
+                if name not in self.autologger_sessions:
+                    self.session_checkpoints.discard(name)
+            logger.info("Discarded unfinished autologger sessions.")
+            return
+        for session in sessions:
+            self.open_autologger_session(
+                session["model_id"],
+                session["project_id"],
+                session["hourly_rate"],
+                elapsed_time=timedelta(seconds=session["elapsed"]),
+                notes=session["notes"],
+                running=session["running"],
             )
-            self.timer_window.start()
-            topmost_state = self.config.getboolean("Theme", "timer_topmost", fallback=False)
-            self.timer_window.root.attributes("-topmost", topmost_state)
-            logger.info("Timer window reinitialized with new settings.")
+        logger.info(f"Resumed {len(sessions)} autologger sessions.")
+
+    def update_timer_panel(self):
+        if not self.timer_windows:
+            if self.timer_panel.winfo_manager():
+                self.timer_panel.pack_forget()
+            self.timer_tree.delete(*self.timer_tree.get_children())
+            return
+        if not self.timer_panel.winfo_manager():
+            self.timer_panel.pack(side="bottom", fill="x", padx=5, pady=(5, 0), before=self.timer_panel_anchor)
+        for item in self.timer_tree.get_children():
+            if item not in self.timer_windows:
+                self.timer_tree.delete(item)
+        for name, timer_window in self.timer_windows.items():
+            values = (
+                name,
+                format_elapsed(timer_window.current_elapsed().total_seconds()),
+                "Running" if timer_window.running else "Paused",
+            )
+            if self.timer_tree.exists(name):
+                self.timer_tree.item(name, values=values)
+            else:
+                self.timer_tree.insert("", "end", iid=name, values=values)
 
     def choose_time_color(self):
-        if self.timer_window:
+        if self.timer_windows:
             response = messagebox.askyesno(
                 "Restart Timer Required",
                 "Changing the timer color requires restarting the timer. Do you want to proceed?",
@@ -777,15 +3814,17 @@ class ShyftGUI:
             if not response:
                 return
         logger.debug("Entering choose_time_color.")
+        from tkinter import colorchooser
+
         color_code = colorchooser.askcolor(title="Choose Stopclock Timestring Color")[1]
         if color_code:
             self.time_color = color_code
             self.save_config()
-            if self.timer_window:
+            if self.timer_windows:
                 self.reinitialize_timer_window()
 
     def choose_bg_color(self):
-        if self.timer_window:
+        if self.timer_windows:
             response = messagebox.askyesno(
                 "Restart Timer Required",
                 "Changing the background color requires restarting the timer. Do you want to proceed?",
@@ -793,15 +3832,17 @@ class ShyftGUI:
             if not response:
                 return
         logger.debug("Entering choose_bg_color.")
+        from tkinter import colorchooser
+
         color_code = colorchooser.askcolor(title="Choose Stopclock Background Color")[1]
         if color_code:
             self.bg_color = color_code
             self.save_config()
-            if self.timer_window:
+            if self.timer_windows:
                 self.reinitialize_timer_window()
 
     def choose_btn_text_color(self):
-        if self.timer_window:
+        if self.timer_windows:
             response = messagebox.askyesno(
                 "Restart Timer Required",
                 "Changing the button text color requires restarting the timer. Do you want to proceed?",
@@ -809,31 +3850,29 @@ class ShyftGUI:
             if not response:
                 return
         logger.debug("Entering choose_btn_text_color.")
+        from tkinter import colorchooser
+
         color_code = colorchooser.askcolor(title="Choose Stopclock Button Text Color")[1]
         if color_code:
             self.btn_text_color = color_code
             self.save_config()
-            if self.timer_window:
+            if self.timer_windows:
                 self.reinitialize_timer_window()
 
     def save_config(self):
-        if not self.config.has_section("Colors"):
-            self.config.add_section("Colors")
-        if not self.config.has_section("Window"):
-            self.config.add_section("Window")
         self.config.set("Colors", "time_color", self.time_color)
         self.config.set("Colors", "bg_color", self.bg_color)
         self.config.set("Colors", "btn_text_color", self.btn_text_color)
-        if self.timer_window:
-            self.config.set("Window", "width", str(self.timer_window.root.winfo_width()))
-            self.config.set("Window", "height", str(self.timer_window.root.winfo_height()))
-        with open(CONFIG_FILE, "w") as config_file:
-            self.config.write(config_file)
+        for timer_window in self.timer_windows.values():
+            self.config.set("Window", "width", timer_window.root.winfo_width())
+            self.config.set("Window", "height", timer_window.root.winfo_height())
         self.update_styles()
         messagebox.showinfo("Settings Saved", "New settings have been applied.")
         logger.info("Configuration saved.")
 
     def autologger(self, event=None):
+        if not self.data_ready():
+            return
         model_id_response = simpledialog.askstring(
             "Model ID", "Enter Model ID", parent=self.root
         )
@@ -847,10 +3886,20 @@ class ShyftGUI:
         if not project_id_response:
             return None
         project_id = project_id_response.upper()
+        self.start_autologger(model_id, project_id)
 
-        hourly_rate = simpledialog.askstring(
-            "Hourly rate", "Enter Hourly Rate", parent=self.root
-        )
+    def start_autologger(self, model_id, project_id, hourly_rate=None):
+        if not model_id or not project_id:
+            return None
+        timer_name = f"{model_id} / {project_id}"
+        if timer_name in self.timer_windows or timer_name in self.autologger_sessions:
+            self.focus_session(timer_name)
+            return None
+
+        if hourly_rate is None:
+            hourly_rate = simpledialog.askstring(
+                "Hourly rate", "Enter Hourly Rate", parent=self.root
+            )
         try:
             hourly_rate = float(hourly_rate)
         except (TypeError, ValueError):
@@ -862,8 +3911,16 @@ class ShyftGUI:
                 )
                 return None
 
+        self.open_autologger_session(model_id, project_id, hourly_rate)
+
+    def open_autologger_session(self, model_id, project_id, hourly_rate, elapsed_time=None, notes="", running=True):
+        timer_name = f"{model_id} / {project_id}"
+        if timer_name in self.autologger_sessions:
+            logger.warning(f"Autologger session {timer_name} is already open.")
+            self.focus_session(timer_name)
+            return
         notes_window = tk.Toplevel(self.root)
-        notes_window.title("Notes - Autologger")
+        notes_window.title(f"Notes - Autologger - {timer_name}")
         if platform.system() == "Darwin":
             notes_window.geometry("400x400")
         else:
@@ -875,6 +3932,9 @@ class ShyftGUI:
             height=1,
         )
         text.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        if notes:
+            text.insert("1.0", notes)
+        text.edit_modified(False)
 
         button_frame = tk.Frame(notes_window)
         button_frame.pack(side=tk.BOTTOM, fill=tk.X)
@@ -883,23 +3943,31 @@ class ShyftGUI:
             divider = "_" * 50 + "\n"
             text.insert(tk.INSERT, divider)
 
-        if self.timer_window is None or not tk.Toplevel.winfo_exists(
-            self.timer_window.root
-        ):
-            timer_window = tk.Toplevel(self.root)
-            self.timer_window = TimerWindow(
-                timer_window, time_color=self.time_color, bg_color=self.bg_color
-            )
-            self.timer_window.start()
-            topmost_state = self.config.getboolean("Theme", "timer_topmost", fallback=False)
-            self.timer_window.root.attributes("-topmost", topmost_state)
-            self.disable_theme_menu()
-            self.enable_topmost_menu()
+        self.notes_windows[timer_name] = notes_window
+        self.autologger_sessions[timer_name] = {
+            "model_id": model_id,
+            "project_id": project_id,
+            "hourly_rate": hourly_rate,
+            "text": text,
+            "notes": notes,
+        }
+        timer_window = self.open_timer_window(timer_name)
+        if elapsed_time is not None:
+            timer_window.elapsed_time = elapsed_time
+            timer_window.refresh(elapsed_time.total_seconds())
+        if running:
+            self.switch_timer(timer_name)
+        else:
+            self.update_timer_panel()
+        self.schedule_checkpoint()
+        self.disable_theme_menu()
+        self.enable_topmost_menu()
 
         def submit_notes():
-            if self.timer_window and tk.Toplevel.winfo_exists(self.timer_window.root):
-                self.timer_window.stop()
-                elapsed_time = self.timer_window.elapsed_time
+            timer_window = self.timer_windows.get(timer_name)
+            if timer_window and tk.Toplevel.winfo_exists(timer_window.root):
+                timer_window.stop()
+                elapsed_time = timer_window.elapsed_time
 
                 seconds_in_a_minute = 60
                 whole_minutes = elapsed_time.total_seconds() // seconds_in_a_minute
@@ -910,30 +3978,24 @@ class ShyftGUI:
                 new_id = max([int(x) for x in self.data.keys()], default=0) + 1
                 formatted_id = self.format_id(new_id)
 
-                if not LOGS_DIR.exists():
-                    LOGS_DIR.mkdir(parents=True, exist_ok=True)
-
-                log_file_path = LOGS_DIR / f"{formatted_id}.md"
-                with open(log_file_path, "w") as file:
-                    file.write(text.get("1.0", tk.END))
-
-                lock = threading.Lock()
-
-                with lock:
-                    self.data[formatted_id] = {
-                        "Date": datetime.now().strftime("%Y-%m-%d"),
-                        "Model ID": model_id,
-                        "Project ID": project_id,
-                        "In (hh:mm)": (datetime.now() - elapsed_time).strftime("%H:%M"),
-                        "Out (hh:mm)": datetime.now().strftime("%H:%M"),
-                        "Duration (hrs)": f"{duration_hrs:.2f}",
-                        "Hourly rate": f"{hourly_rate:.2f}",
-                        "Gross pay": f"{gross_pay:.2f}",
-                    }
-                    save_thread = threading.Thread(
-                        target=lambda: self.save_data_and_update_view(notes_window)
-                    )
-                    save_thread.start()
+                now = datetime.now()
+                notes = text.get("1.0", tk.END)
+                log_file_path = self.notes_manifest.write_note(formatted_id, now.date(), project_id, notes)
+                self.index_note(formatted_id, notes, log_file_path)
+
+                started = now - elapsed_time
+                new_shift = ShiftRecord(
+                    date=now.date().toordinal(),
+                    model_id=model_id,
+                    project_id=project_id,
+                    time_in=started.hour * 60 + started.minute,
+                    time_out=now.hour * 60 + now.minute,
+                    duration=round(duration_hrs * 100),
+                    rate=round(hourly_rate * 100),
+                    gross=round(gross_pay * 100),
+                )
+                self.record_shift(formatted_id, new_shift)
+                self.update_view_after_autologger(timer_name)
                 messagebox.showinfo("Success", "Shift logged successfully.")
                 logger.info("Shift logged successfully.")
             else:
@@ -941,13 +4003,7 @@ class ShyftGUI:
                 logger.error("Failed to log shift: Timer is not running.")
 
         def cancel_notes():
-            if self.timer_window and tk.Toplevel.winfo_exists(self.timer_window.root):
-                self.timer_window.reset()
-                self.timer_window.on_close()
-                self.timer_window = None
-                self.enable_theme_menu()
-                self.disable_topmost_menu()
-            notes_window.destroy()
+            self.close_timer(timer_name)
             self.root.focus_force()
 
         notes_window.protocol("WM_DELETE_WINDOW", cancel_notes)
@@ -974,9 +4030,8 @@ class ShyftGUI:
 
     def change_theme(self, theme_name):
         self.style.theme_use(theme_name)
+        self.selected_theme = theme_name
         self.config.set("Theme", "selected", theme_name)
-        with open(CONFIG_FILE, "w") as config_file:
-            self.config.write(config_file)
         logger.debug(f"Theme selection <{theme_name}> saved to `config.ini`.")
 
     def enable_topmost_menu(self):
@@ -1020,11 +4075,25 @@ class ShyftGUI:
 
     def setup_view_menu(self):
         self.view_menu = tk.Menu(self.menu_bar, tearoff=0)
+        self.view_menu.add_command(
+            label="Export Report...",
+            command=self.export_report_dialog,
+        )
+        self.view_menu.add_command(
+            label="Search Notes...",
+            command=self.search_notes,
+        )
+        self.view_menu.add_separator()
         self.view_menu.add_checkbutton(
             label="Timer Always on Top",
             command=self.toggle_timer_topmost,
             variable=self.timer_topmost_var,
         )
+        self.view_menu.add_checkbutton(
+            label="Virtual Scrolling Table",
+            command=self.toggle_virtual_table,
+            variable=self.virtual_table_var,
+        )
         self.menu_bar.add_cascade(label="View", menu=self.view_menu)
 
     def setup_settings_menu(self):
@@ -1040,30 +4109,122 @@ class ShyftGUI:
         )
         self.menu_bar.add_cascade(label="Settings", menu=self.settings_menu)
 
-def run_tkinter_app():
+def run_tkinter_app(command=None):
+    if log_listener_pid != os.getpid():
+        # A spawned or forked child: pick up the config as it is now.
+        app_config.reload()
+        setup_logging()
+    instance = SingleInstance()
+    if not instance.acquire():
+        # Another launch got the lock after main() looked for one; it may
+        # still be starting its listener.
+        if SingleInstance.forward(command or {"command": "show"}, timeout=INSTANCE_HANDOFF_TIMEOUT):
+            logger.info("Handed off to the running instance.")
+        else:
+            logger.error("Another instance holds the lock but did not answer.")
+        stop_logging()
+        return
+    try:
+        instance.listen()
+    except OSError as e:
+        logger.error(f"Failed to listen for other launches: {e}")
+    if command is not None and command.get("command") != "show":
+        instance.messages.put(command)
+    startup_timer.mark("module")
     root = tk.Tk()
     style = ttk.Style()
-    app = ShyftGUI(root)
-    app.setup_menu()
+    startup_timer.mark("Tk")
+    app = ShyftGUI(root, instance)
     root.bind(f"<{modifier_key}-a>", app.autologger)
     root.bind(f"<{modifier_key}-d>", app.delete_shift)
     root.bind(f"<{modifier_key}-e>", app.edit_shift)
     root.bind(f"<{modifier_key}-n>", app.manual_entry)
     root.bind(f"<{modifier_key}-l>", app.view_logs)
     root.bind(f"<{modifier_key}-t>", app.calculate_totals)
+    root.bind(f"<{modifier_key}-r>", app.export_report_dialog)
+    root.bind(f"<{modifier_key}-f>", app.search_notes)
     root.bind(f"<{modifier_key}-A>", app.autologger)
     root.bind(f"<{modifier_key}-D>", app.delete_shift)
     root.bind(f"<{modifier_key}-E>", app.edit_shift)
     root.bind(f"<{modifier_key}-N>", app.manual_entry)
     root.bind(f"<{modifier_key}-L>", app.view_logs)
     root.bind(f"<{modifier_key}-T>", app.calculate_totals)
+    root.bind(f"<{modifier_key}-R>", app.export_report_dialog)
+    root.bind(f"<{modifier_key}-F>", app.search_notes)
     root.bind_all(f"<{modifier_key}-Q>", app.on_quit)
     root.bind_all(f"<{modifier_key}-q>", app.on_quit)
 
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        instance.close()
+        # multiprocessing children exit without running atexit hooks.
+        app_config.flush()
+        stop_logging()
+
+def run_export(argv):
+    # Headless entry point: `Shyft.py --export report.csv [--from 2024-01]
+    # [--to 2024-06] [--format tsv]`.
+    parser = argparse.ArgumentParser(prog="shyft", description="Export shifts and totals without the GUI.")
+    parser.add_argument("--export", required=True, metavar="PATH")
+    parser.add_argument("--from", dest="start", metavar="DATE", help="YYYY, YYYY-MM or YYYY-MM-DD")
+    parser.add_argument("--to", dest="end", metavar="DATE", help="YYYY, YYYY-MM or YYYY-MM-DD")
+    parser.add_argument("--format", choices=tuple(EXPORT_DIALECTS), help="defaults to the file extension")
+    args = parser.parse_args(argv)
+    try:
+        start = parse_filter_date(args.start)[0] if args.start else None
+        end = parse_filter_date(args.end)[1] if args.end else None
+    except ValueError as e:
+        parser.error(f"invalid date: {e}")
+    storage = open_storage(app_config.get("Storage", "engine", fallback=DEFAULT_STORAGE_ENGINE), read_only=True)
+    try:
+        export_report(storage, args.export, args.format, start, end)
+    finally:
+        storage.close()
+
+def use_separate_process(argv):
+    # The GUI used to always run in a child process so that a terminal gets
+    # its prompt back. That costs a second interpreter start and module
+    # import, so it is skipped when there is no terminal to free (frozen app
+    # bundles, launchers), with --foreground, or with
+    # `[Startup] separate_process = false`.
+    if "--foreground" in argv:
+        return False
+    launched_from_terminal = sys.stdin is not None and sys.stdin.isatty() and not getattr(sys, "frozen", False)
+    return app_config.getboolean("Startup", "separate_process", fallback=launched_from_terminal)
+
+def launch_command(argv):
+    # What this launch asks for: `Shyft.py --autologger MODEL PROJECT
+    # [--rate 25]` starts (or switches to) that timer, anything else just
+    # brings the window forward. Sent to the running instance if there is one.
+    parser = argparse.ArgumentParser(prog="shyft")
+    parser.add_argument("--foreground", action="store_true", help="run the GUI in this process")
+    parser.add_argument("--autologger", nargs=2, metavar=("MODEL", "PROJECT"), help="start an autologger timer")
+    parser.add_argument("--rate", type=float, help="hourly rate for --autologger")
+    args, _ = parser.parse_known_args(argv)
+    if args.autologger:
+        model_id, project_id = args.autologger
+        return {
+            "command": "autologger",
+            "model_id": model_id.upper(),
+            "project_id": project_id.upper(),
+            "hourly_rate": args.rate,
+        }
+    return {"command": "show"}
 
 def main():
-    process = multiprocessing.Process(target=run_tkinter_app)
+    if "--export" in sys.argv[1:]:
+        run_export(sys.argv[1:])
+        return
+    command = launch_command(sys.argv[1:])
+    if SingleInstance.forward(command):
+        logger.info("Handed off to the running instance.")
+        return
+    if not use_separate_process(sys.argv[1:]):
+        logger.info("Application started.")
+        run_tkinter_app(command)
+        return
+    process = multiprocessing.Process(target=run_tkinter_app, args=(command,))
     process.start()
     logger.info("Application started.")
 
@@ -0,0 +1,31 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Shyft creates its data and log directories under the home directory at
+# import time, so the tests get a throwaway one before it is imported.
+os.environ["HOME"] = tempfile.mkdtemp(prefix="shyft-tests-")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src" / "shyft"))
+
+import pytest  # noqa: E402
+
+import Shyft  # noqa: E402
+
+
+def make_shift(date="2024-01-15", model_id="M1", project_id="P1", hours="1.00", rate="20.00", gross=None):
+    return Shyft.ShiftRecord.from_dict({
+        "Date": date,
+        "Model ID": model_id,
+        "Project ID": project_id,
+        "In (hh:mm)": "09:00",
+        "Out (hh:mm)": "10:00",
+        "Duration (hrs)": hours,
+        "Hourly rate": rate,
+        "Gross pay": gross if gross is not None else f"{float(hours) * float(rate):.2f}",
+    })
+
+
+@pytest.fixture
+def shift():
+    return make_shift
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+import Shyft
+
+
+@pytest.fixture
+def rows():
+    rng = random.Random(3)
+    base = Shyft.parse_date_ordinal("2024-01-01")
+    rows = [
+        (base + rng.randint(0, 400), rng.choice(["P1", "P2", ""]), rng.choice(["A", "B"]),
+         rng.randint(1, 3), rng.randint(0, 900), rng.randint(0, 90000))
+        for _ in range(500)
+    ]
+    rows.append((None, "P1", "A", 1, 100, 2000))
+    return rows
+
+
+def expected_groups(rows, key):
+    groups = {}
+    for row in rows:
+        bucket = groups.setdefault(key(row), [0, 0, 0])
+        for i in range(3):
+            bucket[i] += row[3 + i]
+    return sorted((label, *bucket) for label, bucket in groups.items())
+
+
+def summarize(groups):
+    return [(label, count, hours, gross) for label, count, hours, gross, _ in groups]
+
+
+@pytest.mark.parametrize("dimension, key", [
+    ("Project ID", lambda row: row[1] or "(none)"),
+    ("Model ID", lambda row: row[2] or "(none)"),
+    ("Month", lambda row: Shyft.month_label(row[0]) if row[0] else "(no date)"),
+    ("ISO Week", lambda row: Shyft.iso_week_label(row[0]) if row[0] else "(no date)"),
+])
+def test_groups_match_a_plain_sum(rows, dimension, key):
+    analytics = Shyft.ShiftAnalytics(rows)
+    assert summarize(analytics.group(dimension)) == expected_groups(rows, key)
+
+
+def test_numpy_and_stdlib_paths_agree(rows, monkeypatch):
+    numpy = pytest.importorskip("numpy")
+    with_numpy = Shyft.ShiftAnalytics(rows)
+    fast_groups = {
+        dimension: with_numpy.group_numpy(dimension, numpy.arange(with_numpy.size))
+        for dimension in Shyft.ShiftAnalytics.DIMENSIONS
+    }
+    monkeypatch.setattr(Shyft, "numpy", None)
+    without_numpy = Shyft.ShiftAnalytics(rows)
+    for dimension, fast in fast_groups.items():
+        slow = without_numpy.group_python(dimension, None)
+        assert sorted((code, count, hours, gross, list(map(int, group_rows)))
+                      for code, count, hours, gross, group_rows in fast) == sorted(slow)
+
+
+def test_drill_down_restricts_to_parent_rows(rows):
+    analytics = Shyft.ShiftAnalytics(rows)
+    for label, count, hours, gross, group_rows in analytics.group("Project ID"):
+        children = analytics.group("Model ID", group_rows)
+        assert sum(child[1] for child in children) == count
+        assert sum(child[3] for child in children) == gross
@@ -0,0 +1,73 @@
+import os
+import time
+
+import Shyft
+
+
+def test_getters_read_cached_values(tmp_path):
+    path = tmp_path / "config.ini"
+    path.write_text("[Window]\nwidth = 320\n\n[Theme]\ntimer_topmost = yes\n\n[View]\nvirtual_table = maybe\n")
+    config = Shyft.AppConfig(path)
+    path.unlink()
+
+    assert config.getint("Window", "width", fallback=200) == 320
+    assert config.getint("Window", "height", fallback=100) == 100
+    assert config.getboolean("Theme", "timer_topmost", fallback=False) is True
+    assert config.getboolean("View", "virtual_table", fallback=False) is False
+    assert config.get("Missing", "option", fallback="x") == "x"
+
+
+def test_set_notifies_listeners_and_debounces_the_write(tmp_path):
+    path = tmp_path / "config.ini"
+    config = Shyft.AppConfig(path, save_delay=0.1)
+    seen = []
+    config.add_listener(lambda *change: seen.append(change))
+
+    assert config.set("Colors", "bg_color", "#123456")
+    assert config.set("Window", "width", 300)
+    assert not config.set("Window", "width", "300")
+    assert seen == [("Colors", "bg_color", "#123456"), ("Window", "width", "300")]
+    assert not path.exists()
+
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert Shyft.AppConfig(path).get("Colors", "bg_color") == "#123456"
+
+
+def test_flush_merges_edits_made_on_disk(tmp_path):
+    path = tmp_path / "config.ini"
+    path.write_text("[Storage]\nengine = sqlite\n")
+    config = Shyft.AppConfig(path, save_delay=60)
+    config.set("Theme", "selected", "clam")
+    with path.open("a") as f:
+        f.write("\n[Logging]\nlevel = DEBUG\n")
+    os.utime(path, ns=(0, 0))
+    assert config.flush()
+
+    saved = Shyft.AppConfig(path)
+    assert saved.get("Storage", "engine") == "sqlite"
+    assert saved.get("Logging", "level") == "DEBUG"
+    assert saved.get("Theme", "selected") == "clam"
+    assert config.get("Logging", "level") == "DEBUG"
+
+
+def test_failed_write_keeps_changes_for_the_next_flush(tmp_path, monkeypatch):
+    path = tmp_path / "config.ini"
+    config = Shyft.AppConfig(path, save_delay=60)
+    config.set("A", "x", "1")
+
+    def failing(target, text):
+        config.set("B", "y", "2")
+        config.set("A", "x", "3")
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(Shyft, "atomic_write_text", failing)
+        assert not config.flush()
+    assert config.flush()
+
+    saved = Shyft.AppConfig(path)
+    assert saved.get("A", "x") == "3"
+    assert saved.get("B", "y") == "2"
+    assert not config.flush()
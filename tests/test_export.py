@@ -0,0 +1,81 @@
+import csv
+import json
+
+import pytest
+
+import Shyft
+
+
+@pytest.fixture
+def data(shift):
+    return {
+        "0001": shift(date="2024-03-01", project_id="P2", hours="1.00", rate="10"),
+        "0002": shift(date="2024-01-01", project_id="P1", hours="2.00", rate="10"),
+        "0003": shift(date="2024-02-01", project_id="P1", hours="0.50", rate="20", gross="oops"),
+    }
+
+
+def test_report_rows_list_shifts_then_group_totals(data):
+    rows = list(Shyft.iter_report_rows(Shyft.shifts_in_date_order(data)))
+    assert rows[0] == ["ID", *Shyft.DEFAULT_SHIFT_STRUCTURE]
+    assert [row[0] for row in rows[1:4]] == ["0002", "0003", "0001"]
+    assert rows[4] == []
+    assert rows[6:] == [
+        ["P1", "M1", 2, "2.50", "20.00"],
+        ["P2", "M1", 1, "1.00", "10.00"],
+        ["Total", "", 3, "3.50", "30.00"],
+    ]
+
+
+def test_export_report_filters_by_date_and_picks_dialect(tmp_path, data):
+    store = Shyft.JsonShiftStore(tmp_path / "data.json")
+    store.write_changes(data)
+    start = Shyft.parse_filter_date("2024-02")[0]
+    Shyft.export_report(store, tmp_path / "report.tsv", start=start)
+    with (tmp_path / "report.tsv").open(newline="") as f:
+        rows = list(csv.reader(f, dialect="excel-tab"))
+    assert [row[0] for row in rows[1:3]] == ["0003", "0001"]
+    assert rows[-1] == ["Total", "", "2", "1.50", "10.00"]
+
+
+def test_sqlite_streams_shifts_in_date_order(tmp_path, data):
+    store = Shyft.SQLiteShiftStore(tmp_path / "data.db", tmp_path / "none.json", tmp_path / "none.journal")
+    store.write_changes(data)
+    start = Shyft.parse_date_ordinal("2024-01-15")
+    assert [shift_id for shift_id, _ in store.iter_shifts(start)] == ["0003", "0001"]
+    store.close()
+
+
+def test_read_only_journal_never_compacts(tmp_path, shift):
+    writer = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal")
+    writer.load()
+    writer.write_changes({"0001": shift()})
+    reader = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal", compact_threshold=1, read_only=True)
+    assert list(reader.load()) == ["0001"]
+    reader.close()
+    assert (tmp_path / "data.journal").exists()
+    assert not (tmp_path / "data.json").exists()
+
+
+def test_read_only_sqlite_store_cannot_write(tmp_path, shift):
+    store = Shyft.SQLiteShiftStore(tmp_path / "data.db", tmp_path / "none.json", tmp_path / "none.journal")
+    store.write_changes({"0001": shift()})
+    store.close()
+
+    reader = Shyft.SQLiteShiftStore(tmp_path / "data.db", read_only=True)
+    assert list(reader.load()) == ["0001"]
+    with pytest.raises(Shyft.sqlite3.OperationalError):
+        reader.write_changes({"0002": shift()})
+    reader.close()
+
+
+def test_read_only_sqlite_falls_back_to_legacy_files(monkeypatch, tmp_path, shift):
+    monkeypatch.setattr(Shyft, "SQLITE_FILE_PATH", tmp_path / "data.db")
+    monkeypatch.setattr(Shyft, "DATA_FILE_PATH", tmp_path / "data.json")
+    monkeypatch.setattr(Shyft, "JOURNAL_FILE_PATH", tmp_path / "data.journal")
+    (tmp_path / "data.json").write_text(json.dumps({"data": {"0001": shift().to_dict()}}))
+
+    storage = Shyft.open_storage("sqlite", read_only=True)
+    assert list(storage.load()) == ["0001"]
+    storage.close()
+    assert not (tmp_path / "data.db").exists()
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+import Shyft
+
+
+def write_snapshot(path, data):
+    path.write_text(json.dumps({"data": Shyft.dump_shift_records(data)}))
+
+
+def test_journal_replays_appends_on_load(tmp_path, shift):
+    write_snapshot(tmp_path / "data.json", {"0001": shift()})
+    journal = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal")
+    journal.load()
+    journal.write_changes({"0002": shift(project_id="P2"), "0001": None})
+
+    data = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal").load()
+    assert list(data) == ["0002"]
+    assert data["0002"].project_id == "P2"
+
+
+def test_journal_compaction_folds_journal_into_snapshot(tmp_path, shift):
+    write_snapshot(tmp_path / "data.json", {"0001": shift()})
+    journal = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal", compact_threshold=2)
+    journal.load()
+    journal.write_changes({"0002": shift()})
+    assert not journal.needs_compaction()
+    journal.write_changes({"0003": shift()})
+    journal.maintain()
+
+    assert not (tmp_path / "data.journal").exists()
+    assert sorted(json.loads((tmp_path / "data.json").read_text())["data"]) == ["0001", "0002", "0003"]
+
+
+def test_journal_skips_torn_last_record(tmp_path, shift):
+    journal = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal")
+    journal.load()
+    journal.write_changes({"0001": shift()})
+    with (tmp_path / "data.journal").open("a") as f:
+        f.write('{"op": "put", "id": "0002", "sh')
+    assert list(Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal").load()) == ["0001"]
+
+
+def test_journal_merges_appends_from_another_process(tmp_path, shift):
+    reader = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal")
+    writer = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal")
+    known = reader.load()
+    writer.load()
+    assert reader.load_changes(known) is None
+    writer.write_changes({"0001": shift()})
+    changes = reader.load_changes(known)
+    assert list(changes) == ["0001"]
+
+
+def test_journal_does_not_compact_after_failed_load(tmp_path, shift, monkeypatch):
+    write_snapshot(tmp_path / "data.json", {"0001": shift(), "0002": shift()})
+    journal = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal", compact_threshold=1)
+
+    def broken(f):
+        raise OSError("unreadable")
+
+    with monkeypatch.context() as m:
+        m.setattr(Shyft.json, "load", broken)
+        with pytest.raises(OSError):
+            journal.load()
+    journal.write_changes({"0003": shift()})
+    journal.maintain()
+    journal.close()
+
+    assert sorted(json.loads((tmp_path / "data.json").read_text())["data"]) == ["0001", "0002"]
+    data = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal").load()
+    assert sorted(data) == ["0001", "0002", "0003"]
@@ -0,0 +1,55 @@
+import os
+import time
+
+import Shyft
+
+
+def wait_for(index, lines):
+    deadline = time.monotonic() + 5
+    while index.line_count() != lines and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return index.line_count()
+
+
+def test_indexes_lines_and_reads_a_page(tmp_path, monkeypatch):
+    monkeypatch.setattr(Shyft, "LOG_INDEX_CHUNK", 64)
+    path = tmp_path / "app.log"
+    path.write_text("".join(f"line {i}\n" for i in range(1000)))
+    index = Shyft.LogFileIndex(path)
+    assert wait_for(index, 1000) == 1000
+    assert index.lines(998, 10) == ["line 998", "line 999"]
+    assert index.lines(500, 2) == ["line 500", "line 501"]
+    index.close()
+
+
+def test_picks_up_appends_and_a_partial_last_line(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("one\ntwo\n")
+    index = Shyft.LogFileIndex(path)
+    assert wait_for(index, 2) == 2
+    assert not index.refresh()
+
+    with path.open("a") as f:
+        f.write("three\nfou")
+    assert index.refresh()
+    assert wait_for(index, 4) == 4
+    assert index.lines(2, 5) == ["three", "fou"]
+    index.close()
+
+
+def test_starts_over_after_rotation_and_truncation(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("old 1\nold 2\nold 3\n")
+    index = Shyft.LogFileIndex(path)
+    assert wait_for(index, 3) == 3
+
+    os.replace(path, tmp_path / "app.log.1")
+    path.write_text("new 1\n")
+    assert index.refresh()
+    assert wait_for(index, 1) == 1
+    assert index.lines(0, 5) == ["new 1"]
+
+    path.write_text("")
+    assert index.refresh()
+    assert index.line_count() == 0
+    index.close()
@@ -0,0 +1,51 @@
+from datetime import date
+
+import Shyft
+
+
+def test_archive_packs_old_notes_and_reads_them_back(tmp_path):
+    manifest = Shyft.NotesManifest(tmp_path)
+    manifest.write_note("0001", date(2020, 1, 5), "P1", "january one")
+    manifest.write_note("0002", date(2020, 1, 20), "P1", "january two")
+    manifest.write_note("0003", date(2020, 2, 1), "P1", "february")
+    manifest.write_note("0004", date(2024, 1, 1), "P1", "recent")
+    manifest.archive(date(2021, 1, 1))
+
+    entries = Shyft.NotesManifest(tmp_path).load()
+    assert entries["0001"]["archive"] == entries["0002"]["archive"] == "archive/2020-01.gz"
+    assert entries["0002"]["offset"] == entries["0001"]["offset"] + entries["0001"]["length"]
+    assert "archive" not in entries["0004"]
+    assert not (tmp_path / "2020").exists()
+    for shift_id, text in (("0001", "january one"), ("0002", "january two"), ("0003", "february")):
+        assert manifest.read_archived(entries[shift_id]) == text.encode()
+    assert dict(manifest.note_files())["0001"] is None
+
+
+def test_archiving_again_appends_to_the_segment(tmp_path):
+    manifest = Shyft.NotesManifest(tmp_path)
+    manifest.write_note("0001", date(2020, 1, 5), "P1", "one")
+    manifest.archive(date(2021, 1, 1))
+    manifest.write_note("0002", date(2020, 1, 6), "P1", "two")
+    manifest.archive(date(2021, 1, 1))
+    assert manifest.read_archived_note("0001") == b"one"
+    assert manifest.read_archived_note("0002") == b"two"
+
+
+def test_recreated_index_includes_archived_notes(tmp_path):
+    manifest = Shyft.NotesManifest(tmp_path / "notes")
+    manifest.write_note("0001", date(2020, 1, 5), "P1", "archived zebra")
+    manifest.write_note("0002", date(2024, 1, 5), "P1", "current zebra")
+    manifest.archive(date(2021, 1, 1))
+
+    index = Shyft.NotesIndex(tmp_path / "notes.db")
+    index.sync(manifest.note_files(), manifest.read_archived_note)
+    assert sorted(shift_id for shift_id, _ in index.search("zebra")) == ["0001", "0002"]
+    index.close()
+
+
+def test_bytes_line_index_pages_an_archived_note():
+    index = Shyft.BytesLineIndex("one\ntwo\nthree".encode())
+    assert index.line_count() == 3
+    assert index.lines(1, 5) == ["two", "three"]
+    assert not index.refresh()
+    index.close()
@@ -0,0 +1,42 @@
+import Shyft
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_index_searches_by_prefix_and_follows_changes(tmp_path):
+    first = write(tmp_path / "0001.md", "reviewed the zebra dataset")
+    second = write(tmp_path / "0002.md", "nothing interesting")
+    index = Shyft.NotesIndex(tmp_path / "notes.db")
+    index.sync([("0001", first), ("0002", second)])
+    assert [shift_id for shift_id, _ in index.search("zeb data")] == ["0001"]
+    assert index.search("") == []
+
+    write(second, "another zebra, larger this time")
+    index.sync([("0002", second)])
+    assert [shift_id for shift_id, _ in index.search("zebra")] == ["0002"]
+    index.close()
+
+
+def test_sync_only_reads_changed_notes(tmp_path, monkeypatch):
+    note = write(tmp_path / "0001.md", "alpha")
+    index = Shyft.NotesIndex(tmp_path / "notes.db")
+    index.sync([("0001", note)])
+    added = []
+    monkeypatch.setattr(index, "add_notes", added.extend)
+    index.sync([("0001", note)])
+    assert added == []
+    index.close()
+
+
+def test_snippets_mark_the_match(tmp_path):
+    note = write(tmp_path / "0001.md", "first line\nthe quick brown fox")
+    index = Shyft.NotesIndex(tmp_path / "notes.db")
+    index.add_note("0001", note.read_text(), Shyft.file_signature(note))
+    (shift_id, snippet), = index.search("quick")
+    assert shift_id == "0001"
+    assert "quick" in snippet and "\n" not in snippet
+    index.close()
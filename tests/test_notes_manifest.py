@@ -0,0 +1,53 @@
+import json
+from datetime import date
+
+import Shyft
+
+
+def test_manifest_lists_notes_by_shard(tmp_path):
+    manifest = Shyft.NotesManifest(tmp_path)
+    path = manifest.write_note("0001", date(2024, 3, 9), "P1", "first")
+    manifest.write_note("0002", None, "", "undated")
+    manifest.write_note("0001", date(2024, 3, 9), "P1", "first, edited")
+
+    assert path == tmp_path / "2024" / "03" / "0001.md"
+    entries = Shyft.NotesManifest(tmp_path).load()
+    assert entries["0001"]["path"] == "2024/03/0001.md"
+    assert entries["0001"]["size"] == len("first, edited")
+    assert entries["0002"]["path"] == "undated/0002.md"
+    for line in (tmp_path / "manifest.jsonl").read_text().splitlines():
+        assert json.loads(line)["id"] in ("0001", "0002")
+
+
+def test_manifest_compacts_superseded_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(Shyft, "NOTES_MANIFEST_SLACK", 2)
+    manifest = Shyft.NotesManifest(tmp_path)
+    for revision in range(10):
+        manifest.write_note("0001", date(2024, 1, 1), "P1", f"revision {revision}")
+
+    reader = Shyft.NotesManifest(tmp_path)
+    assert reader.load()["0001"]["size"] == len("revision 9")
+    assert len((tmp_path / "manifest.jsonl").read_text().splitlines()) == 1
+
+
+def test_manifest_picks_up_appends_from_another_process(tmp_path):
+    reader = Shyft.NotesManifest(tmp_path)
+    writer = Shyft.NotesManifest(tmp_path)
+    writer.write_note("0001", date(2024, 1, 1), "P1", "one")
+    assert list(reader.load()) == ["0001"]
+    writer.write_note("0002", date(2024, 1, 2), "P1", "two")
+    assert sorted(reader.load()) == ["0001", "0002"]
+
+
+def test_manifest_migrates_flat_notes(tmp_path, shift):
+    legacy = tmp_path / "logs"
+    legacy.mkdir()
+    (legacy / "0001.md").write_text("old note")
+    manifest = Shyft.NotesManifest(tmp_path / "notes")
+    manifest.migrate(legacy, {"0001": shift(date="2023-07-04", project_id="P7")})
+
+    assert not (legacy / "0001.md").exists()
+    entry = manifest.load()["0001"]
+    assert entry["path"] == "2023/07/0001.md"
+    assert entry["project"] == "P7"
+    assert dict(manifest.note_files())["0001"] == tmp_path / "notes" / "2023" / "07" / "0001.md"
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+import Shyft
+
+
+@pytest.fixture
+def data(shift):
+    rng = random.Random(5)
+    return {
+        f"{i:04d}": shift(
+            date=f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            model_id=rng.choice(["ALPHA", "BETA"]),
+            project_id=rng.choice(["P1", "P2", "Q9"]),
+            hours=f"{rng.randint(1, 80) / 10:.2f}",
+        )
+        for i in range(1, 201)
+    }
+
+
+def test_rollups_incremental_updates_match_rebuild(tmp_path, data, shift):
+    rollups = Shyft.ShiftRollups(tmp_path / "rollups.json")
+    rollups.rebuild(data)
+    changes = {
+        "0001": shift(date="2024-06-03", project_id="P2", hours="2.00"),
+        "0002": None,
+        "0500": shift(date="2024-12-31", project_id="NEW"),
+    }
+    for shift_id, new in changes.items():
+        rollups.update(shift_id, data.get(shift_id), new)
+    Shyft.apply_shift_changes(data, changes)
+
+    rebuilt = Shyft.ShiftRollups(tmp_path / "other.json")
+    rebuilt.rebuild(data)
+    assert rollups.tables == rebuilt.tables
+    assert rollups.fingerprint == rebuilt.fingerprint
+
+
+def test_rollups_trust_saved_copy_only_when_fingerprint_matches(tmp_path, data, shift, monkeypatch):
+    rollups = Shyft.ShiftRollups(tmp_path / "rollups.json")
+    rollups.rebuild(data)
+    rollups.save(rollups.snapshot())
+
+    loaded = Shyft.ShiftRollups(tmp_path / "rollups.json")
+    monkeypatch.setattr(loaded, "add", lambda *args: pytest.fail("rebuilt a consistent copy"))
+    loaded.rebuild(data)
+    assert loaded.tables == rollups.tables
+    monkeypatch.undo()
+
+    data["0001"] = shift(hours="9.99")
+    stale = Shyft.ShiftRollups(tmp_path / "rollups.json")
+    stale.rebuild(data)
+    fresh = Shyft.ShiftRollups(tmp_path / "fresh.json")
+    fresh.rebuild(data)
+    assert stale.tables == fresh.tables
+
+
+def test_rollup_period_report(tmp_path, shift):
+    rollups = Shyft.ShiftRollups(tmp_path / "rollups.json")
+    rollups.rebuild({
+        "0001": shift(date="2024-01-30", project_id="P1", hours="1.00", rate="10"),
+        "0002": shift(date="2024-01-31", project_id="P2", hours="2.00", rate="10"),
+        "0003": shift(date="2024-02-01", project_id="P1", hours="3.00", rate="10"),
+    })
+    report = rollups.period_report("month")
+    assert [(period, count, hours, gross) for period, count, hours, gross, _ in report] == [
+        ("2024-01", 2, 300, 3000),
+        ("2024-02", 1, 300, 3000),
+    ]
+    assert report[0][4] == [("P1", 1, 100, 1000), ("P2", 1, 200, 2000)]
@@ -0,0 +1,35 @@
+import Shyft
+
+
+def state(elapsed=60, notes="working"):
+    return {"model_id": "M1", "project_id": "P1", "hourly_rate": 20.0, "elapsed": elapsed, "running": True, "notes": notes}
+
+
+def test_checkpoint_is_only_rewritten_when_state_changes(tmp_path):
+    checkpoints = Shyft.SessionCheckpoints(tmp_path / "sessions")
+    assert checkpoints.save("M1 / P1", state())
+    path = checkpoints.path("M1 / P1")
+    mtime = path.stat().st_mtime_ns
+    assert not checkpoints.save("M1 / P1", state())
+    assert path.stat().st_mtime_ns == mtime
+    assert checkpoints.save("M1 / P1", state(elapsed=61))
+
+
+def test_load_all_returns_saved_sessions(tmp_path):
+    checkpoints = Shyft.SessionCheckpoints(tmp_path / "sessions")
+    checkpoints.save("M1 / P1", state())
+    checkpoints.save("M2 / P2", state(notes="other"))
+    (tmp_path / "sessions" / "broken.json").write_text("{")
+
+    sessions = Shyft.SessionCheckpoints(tmp_path / "sessions").load_all()
+    assert sorted(session["notes"] for session in sessions) == ["other", "working"]
+    assert all("checkpointed_at" in session for session in sessions)
+
+
+def test_discard_removes_the_file(tmp_path):
+    checkpoints = Shyft.SessionCheckpoints(tmp_path / "sessions")
+    checkpoints.save("M1 / P1", state())
+    checkpoints.discard("M1 / P1")
+    checkpoints.discard("never saved")
+    assert checkpoints.load_all() == []
+    assert checkpoints.save("M1 / P1", state())
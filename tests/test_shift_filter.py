@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+import Shyft
+
+
+@pytest.fixture
+def data(shift):
+    rng = random.Random(11)
+    return {
+        f"{i:04d}": shift(
+            date=f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            model_id=rng.choice(["ALPHA", "BETA"]),
+            project_id=rng.choice(["P1", "P2", "Q9"]),
+            hours=f"{rng.randint(1, 80) / 10:.2f}",
+            rate=str(rng.choice([15, 20, 30])),
+        )
+        for i in range(1, 301)
+    }
+
+
+def sort_indexes(data):
+    indexes = {}
+
+    def sort_index(column):
+        if column not in indexes:
+            indexes[column] = Shyft.SortIndex(column)
+            indexes[column].rebuild(data)
+        return indexes[column]
+
+    return sort_index
+
+
+@pytest.mark.parametrize("text, predicate", [
+    ("p1", lambda s: s.project_id.startswith("P1") or s.model_id.startswith("P1")),
+    ("project:p", lambda s: s.project_id.startswith("P")),
+    ("model=beta rate>=20", lambda s: s.model_id == "BETA" and s.rate >= 2000),
+    ("hours<2", lambda s: s.duration < 200),
+    ("date:2024-03", lambda s: "2024-03-01" <= Shyft.format_date_ordinal(s.date) <= "2024-03-31"),
+    ("date:2024-02..2024-04", lambda s: "2024-02-01" <= Shyft.format_date_ordinal(s.date) <= "2024-04-30"),
+    ("pay>100", lambda s: s.gross > 10000),
+])
+def test_filter_matches_a_scan(data, text, predicate):
+    shift_filter = Shyft.ShiftFilter(text)
+    assert not shift_filter.errors
+    assert shift_filter.matching_ids(sort_indexes(data)) == {k for k, v in data.items() if predicate(v)}
+
+
+@pytest.mark.parametrize("term", ["rate>inf", "pay<1e999", "hours>nan", "date:2024-13", "rate>abc"])
+def test_filter_lists_unparsable_terms(term):
+    shift_filter = Shyft.ShiftFilter(f"p1 {term}")
+    assert shift_filter.errors == [term]
+    assert len(shift_filter.terms) == 1
+
+
+def test_empty_filter_is_falsy():
+    assert not Shyft.ShiftFilter("")
+    assert not Shyft.ShiftFilter("rate>abc")
@@ -0,0 +1,23 @@
+import pytest
+
+import Shyft
+
+
+def test_shift_record_round_trips_strings():
+    shift = Shyft.ShiftRecord.from_dict({"Date": "2024-02-01", "Hourly rate": "25", "Gross pay": "oops"})
+    assert shift.rate == 2500
+    assert shift.get("Hourly rate") == "25.00"
+    assert shift.get("Gross pay") == "oops"
+    assert shift.to_dict()["Date"] == "2024-02-01"
+
+
+def test_shift_records_compare_by_value(shift):
+    assert shift() == shift()
+    assert shift() != shift(hours="2.00")
+
+
+@pytest.mark.parametrize("value", ["inf", "-inf", "nan", "1e999", "1e307"])
+def test_non_finite_amounts_are_kept_raw(value):
+    shift = Shyft.ShiftRecord.from_dict({"Hourly rate": value})
+    assert shift.rate is None
+    assert shift.get("Hourly rate") == value
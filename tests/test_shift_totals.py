@@ -0,0 +1,26 @@
+import Shyft
+
+
+def test_totals_follow_updates(shift):
+    totals = Shyft.ShiftTotals()
+    data = {"0001": shift(hours="1.50", rate="20"), "0002": shift(hours="2.00", rate="10")}
+    totals.rebuild(data)
+    assert (totals.count, totals.hours, totals.gross) == (2, 350, 5000)
+
+    totals.update("0001", data["0001"], shift(hours="1.00", rate="20"))
+    totals.update("0002", data["0002"], None)
+    totals.update("0003", None, shift(hours="0.25", rate="40"))
+    assert (totals.count, totals.hours, totals.gross) == (2, 125, 3000)
+
+
+def test_totals_list_invalid_records(shift):
+    totals = Shyft.ShiftTotals()
+    bad = shift(hours="n/a", gross="oops")
+    totals.rebuild({"0001": shift(), "0002": bad, "0003": shift(gross="?")})
+    assert totals.count == 3
+    assert totals.hours == 200
+    assert totals.invalid == {"0002": ["Duration (hrs)", "Gross pay"], "0003": ["Gross pay"]}
+
+    totals.update("0002", bad, None)
+    assert "0002" not in totals.invalid
+    assert totals.count == 2
@@ -0,0 +1,66 @@
+import os
+import sys
+
+import pytest
+
+import Shyft
+
+
+@pytest.fixture
+def instance(tmp_path):
+    instance = Shyft.SingleInstance(tmp_path / "instance.lock", tmp_path / "instance.json")
+    yield instance
+    instance.close()
+
+
+def test_second_lock_is_refused(tmp_path, instance):
+    assert instance.acquire()
+    other = Shyft.SingleInstance(tmp_path / "instance.lock", tmp_path / "instance.json")
+    assert not other.acquire()
+    instance.close()
+    assert other.acquire()
+    other.close()
+
+
+def test_forward_round_trip(tmp_path, instance):
+    info_path = tmp_path / "instance.json"
+    assert not Shyft.SingleInstance.forward({"command": "show"}, info_path)
+    assert instance.acquire()
+    instance.listen()
+    message = {"command": "autologger", "model_id": "M1", "project_id": "P1", "hourly_rate": 20.0}
+    assert Shyft.SingleInstance.forward(message, info_path)
+    assert instance.messages.get(timeout=5) == message
+    if sys.platform != "win32":
+        assert info_path.stat().st_mode & 0o077 == 0
+
+    instance.close()
+    assert not info_path.exists()
+    assert not Shyft.SingleInstance.forward({"command": "show"}, info_path)
+
+
+def test_wrong_key_is_rejected(tmp_path, instance):
+    info_path = tmp_path / "instance.json"
+    instance.acquire()
+    instance.listen()
+    info = Shyft.json.loads(info_path.read_text())
+    info["authkey"] = os.urandom(32).hex()
+    info_path.write_text(Shyft.json.dumps(info))
+    assert not Shyft.SingleInstance.forward({"command": "show"}, info_path)
+    assert instance.messages.empty()
+
+
+def test_launch_command_parsing():
+    assert Shyft.launch_command([]) == {"command": "show"}
+    assert Shyft.launch_command(["--autologger", "m1", "p1", "--rate", "25"]) == {
+        "command": "autologger", "model_id": "M1", "project_id": "P1", "hourly_rate": 25.0,
+    }
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_private_json_is_created_owner_only(tmp_path):
+    path = tmp_path / "instance.json"
+    leftover = tmp_path / "instance.json.tmp"
+    leftover.write_text("stale")
+    leftover.chmod(0o644)
+    Shyft.atomic_write_json(path, {"authkey": "00"}, private=True)
+    assert path.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+import Shyft
+
+
+@pytest.fixture
+def data(shift):
+    rng = random.Random(7)
+    return {
+        f"{i:04d}": shift(
+            date=f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            hours=f"{rng.randint(1, 80) / 10:.2f}",
+            rate=str(rng.choice([15, 20, 30])),
+        )
+        for i in range(1, 301)
+    }
+
+
+def test_sort_index_orders_by_column_then_id(data):
+    index = Shyft.SortIndex("Hourly rate")
+    index.rebuild(data)
+    expected = sorted(data, key=lambda shift_id: (data[shift_id].rate, int(shift_id)))
+    assert index.ordered_ids() == expected
+    assert index.ordered_ids(descending=True) == expected[::-1]
+    assert index.position(expected[10]) == 10
+
+
+def test_sort_index_updates_match_rebuild(data, shift):
+    index = Shyft.SortIndex("Date")
+    index.rebuild(data)
+    index.update("0005", data["0005"], shift(date="2023-01-01"))
+    index.update("0006", data["0006"], None)
+    index.update("0999", None, shift(date="2025-01-01"))
+    data = dict(data, **{"0005": shift(date="2023-01-01"), "0999": shift(date="2025-01-01")})
+    del data["0006"]
+    rebuilt = Shyft.SortIndex("Date")
+    rebuilt.rebuild(data)
+    assert index.entries == rebuilt.entries
+    assert index.ordered_ids()[0] == "0005"
+    assert index.ordered_ids()[-1] == "0999"
+
+
+def test_unparsable_values_sort_last(shift):
+    data = {"0001": shift(rate="oops", gross="0"), "0002": shift(rate="30"), "0003": shift(rate="10")}
+    index = Shyft.SortIndex("Hourly rate")
+    index.rebuild(data)
+    assert index.ordered_ids() == ["0003", "0002", "0001"]
+
+
+def test_sort_index_range(data):
+    index = Shyft.SortIndex("Hourly rate")
+    index.rebuild(data)
+    assert index.range_ids(2000, 2000) == {k for k, v in data.items() if v.rate == 2000}
+    assert index.range_ids(2000, None, include_low=False) == {k for k, v in data.items() if v.rate > 2000}
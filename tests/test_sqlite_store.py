@@ -0,0 +1,30 @@
+import json
+
+import Shyft
+
+
+def test_sqlite_migrates_legacy_files_once(tmp_path, shift):
+    (tmp_path / "data.json").write_text(json.dumps({"data": {"0001": shift().to_dict()}}))
+    journal = Shyft.ShiftJournal(tmp_path / "data.json", tmp_path / "data.journal")
+    journal.load()
+    journal.write_changes({"0002": shift(project_id="P2")})
+
+    store = Shyft.SQLiteShiftStore(tmp_path / "data.db", tmp_path / "data.json", tmp_path / "data.journal")
+    assert sorted(store.load()) == ["0001", "0002"]
+    store.write_changes({"0001": None})
+    store.close()
+
+    store = Shyft.SQLiteShiftStore(tmp_path / "data.db", tmp_path / "data.json", tmp_path / "data.journal")
+    assert list(store.load()) == ["0002"]
+    store.close()
+
+
+def test_sqlite_reports_commits_from_other_connections(tmp_path, shift):
+    reader = Shyft.SQLiteShiftStore(tmp_path / "data.db", tmp_path / "none.json", tmp_path / "none.journal")
+    writer = Shyft.SQLiteShiftStore(tmp_path / "data.db", tmp_path / "none.json", tmp_path / "none.journal")
+    known = reader.load()
+    assert reader.load_changes(known) is None
+    writer.write_changes({"0001": shift()})
+    assert list(reader.load_changes(known)) == ["0001"]
+    reader.close()
+    writer.close()
@@ -0,0 +1,103 @@
+import time
+
+import pytest
+
+import Shyft
+
+
+class RecordingStore:
+    def __init__(self):
+        self.batches = []
+
+    def write_changes(self, changes):
+        self.batches.append(dict(changes))
+
+    def maintain(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_writer_coalesces_a_burst_into_one_write(shift):
+    store = RecordingStore()
+    writer = Shyft.StorageWriter(store, coalesce_delay=0.05)
+    futures = [writer.submit("0001", shift(hours=str(hours))) for hours in range(1, 6)]
+    futures.append(writer.submit("0002", None))
+    for future in futures:
+        future.result(timeout=5)
+    writer.close()
+
+    assert len(store.batches) == 1
+    assert store.batches[0]["0001"].duration == 500
+    assert store.batches[0]["0002"] is None
+
+
+def test_writer_overlay_applies_queued_changes(shift):
+    store = RecordingStore()
+    writer = Shyft.StorageWriter(store, coalesce_delay=10)
+    writer.submit("0002", shift(project_id="NEW"))
+    writer.submit("0001", None)
+    data = writer.overlay({"0001": shift(), "0003": shift()})
+    assert sorted(data) == ["0002", "0003"]
+    assert writer.pending_ids() == {"0001", "0002"}
+    writer.close()
+    assert len(store.batches) == 1
+
+
+def test_writer_reports_failures_to_futures(shift):
+    class FailingStore(RecordingStore):
+        def write_changes(self, changes):
+            raise OSError("disk full")
+
+    writer = Shyft.StorageWriter(FailingStore(), coalesce_delay=0)
+    future = writer.submit("0001", shift())
+    with pytest.raises(OSError):
+        future.result(timeout=5)
+    writer.close()
+
+
+def test_writer_retries_a_failed_batch(shift):
+    class FlakyStore(RecordingStore):
+        failures = 1
+
+        def write_changes(self, changes):
+            if self.failures:
+                self.failures -= 1
+                raise OSError("disk full")
+            super().write_changes(changes)
+
+    store = FlakyStore()
+    writer = Shyft.StorageWriter(store, coalesce_delay=0, retry_delay=0.05)
+    first = writer.submit("0001", shift())
+    with pytest.raises(OSError):
+        first.result(timeout=5)
+    assert "0001" in writer.pending_ids()
+    writer.submit("0002", shift()).result(timeout=5)
+    writer.close()
+
+    written = {}
+    for batch in store.batches:
+        written.update(batch)
+    assert sorted(written) == ["0001", "0002"]
+
+
+def test_writer_keeps_newer_values_over_a_failed_batch(shift):
+    class SlowFailingStore(RecordingStore):
+        failures = 1
+
+        def write_changes(self, changes):
+            if self.failures:
+                self.failures -= 1
+                writer.submit("0001", shift(project_id="NEWER"))
+                raise OSError("disk full")
+            super().write_changes(changes)
+
+    store = SlowFailingStore()
+    writer = Shyft.StorageWriter(store, coalesce_delay=0, retry_delay=0.05)
+    writer.submit("0001", shift(project_id="OLDER"))
+    deadline = time.monotonic() + 5
+    while not store.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.close()
+    assert store.batches[-1]["0001"].project_id == "NEWER"
@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+import Shyft
+
+
+class FakeRoot:
+    def __init__(self):
+        self.jobs = {}
+        self.next_id = 0
+
+    def after(self, delay_ms, callback):
+        self.next_id += 1
+        self.jobs[self.next_id] = (delay_ms, callback)
+        return self.next_id
+
+    def after_cancel(self, job):
+        del self.jobs[job]
+
+    def run_next(self):
+        job = min(self.jobs, key=lambda job: self.jobs[job][0])
+        delay_ms, callback = self.jobs.pop(job)
+        callback()
+        return delay_ms
+
+
+class FakeTimer:
+    def __init__(self, elapsed, running=True):
+        self.elapsed = elapsed
+        self.running = running
+        self.shown = []
+
+    def current_elapsed(self):
+        return timedelta(seconds=self.elapsed)
+
+    def refresh(self, elapsed):
+        self.shown.append(int(elapsed))
+
+
+def test_format_elapsed():
+    assert Shyft.format_elapsed(0) == "00:00:00"
+    assert Shyft.format_elapsed(3725.9) == "01:02:05"
+
+
+def test_one_job_wakes_at_the_soonest_second_boundary():
+    root = FakeRoot()
+    scheduler = Shyft.TimerScheduler(root)
+    slow, fast = FakeTimer(10.5), FakeTimer(4.75)
+    scheduler.register(slow)
+    scheduler.register(fast)
+    scheduler.wake()
+
+    assert len(root.jobs) == 1
+    delay_ms, _ = next(iter(root.jobs.values()))
+    assert delay_ms == 251
+    assert slow.shown == [10] and fast.shown == [4]
+
+
+def test_idle_when_nothing_runs_and_listeners_still_called():
+    root = FakeRoot()
+    scheduler = Shyft.TimerScheduler(root)
+    calls = []
+    scheduler.add_listener(lambda: calls.append(1))
+    timer = FakeTimer(1.5)
+    scheduler.register(timer)
+    scheduler.wake()
+    assert root.jobs
+
+    timer.running = False
+    scheduler.wake()
+    assert not root.jobs
+    assert len(calls) == 2
+
+    scheduler.unregister(timer)
+    assert not root.jobs
+    assert scheduler.timers == []
+
+
+def test_wake_replaces_the_pending_job():
+    root = FakeRoot()
+    scheduler = Shyft.TimerScheduler(root)
+    scheduler.register(FakeTimer(0.5))
+    scheduler.wake()
+    scheduler.wake()
+    assert len(root.jobs) == 1
+    root.run_next()
+    assert len(root.jobs) == 1